@@ -4,21 +4,43 @@ Conversion API endpoints for the LaTeX → HTML5 Converter application.
 This module provides endpoints for file upload and conversion processing.
 """
 
-import json
+import asyncio
+import heapq
 import os
+import re
+import secrets
 import shutil
+import stat
+import tarfile
 import threading
-import uuid
-from datetime import datetime, timedelta
+import time
+import zipfile
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
+import aiofiles
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+)
 from fastapi.responses import FileResponse
 from loguru import logger
+from pydantic_core import from_json
 
 from app.config import settings
-from app.models.conversion import ConversionOptions
+from app.models.conversion import ConversionJob, ConversionOptions
 from app.models.conversion import ConversionStatus as ConversionStatusEnum
 from app.models.response import (
     ContentMetrics,
@@ -36,7 +58,9 @@ from app.services.orchestrator import (
     ResourceLimitError,
     get_orchestrator,
 )
-from app.utils.fs import ensure_sufficient_disk_space
+from app.services.pipeline import ConversionPipeline
+from app.utils.fs import ensure_sufficient_disk_space, remove_directories
+from app.utils.path_utils import validate_path_depth
 
 router = APIRouter()
 
@@ -45,7 +69,8 @@ router = APIRouter()
 # ============================================================================
 # NOTE: These global variables implement a simple in-memory storage pattern.
 # This is acceptable for the following reasons:
-# 1. Thread-Safety: All access is protected by _storage_lock (RLock)
+# 1. Thread-Safety: Storage is split into shards, each protected by its own
+#    lock, so requests for unrelated conversions never contend
 # 2. Single Instance: FastAPI runs in a single process with multiple threads
 # 3. Simplicity: Avoids complexity of external database for MVP
 # 4. Production Path: Clearly documented that this should be replaced with
@@ -57,29 +82,196 @@ router = APIRouter()
 # - FastAPI dependency injection for better testability
 # ============================================================================
 
-_conversion_storage: dict[str, dict[str, Any]] = {}  # Job metadata storage
-_storage_lock = threading.RLock()  # Reentrant lock for thread-safe access
+# Job metadata storage, sharded by conversion ID (see _ShardedConversionStore)
+_STORAGE_SHARD_COUNT = 16
+# Set while the store is over MAX_TRACKED_CONVERSIONS. Any number of
+# requests collapse into one eviction pass of the cleanup thread.
+_eviction_requested = threading.Event()
+_EVICTION_BATCH_SIZE = 256  # Job statuses looked up per batch when evicting
+# Min-heap of (expiry timestamp, conversion ID). The cleanup thread sleeps on
+# the condition until the earliest entry is due instead of polling.
+_expiry_heap: list[tuple[float, str]] = []
+_expiry_cv = threading.Condition()
+_EXPIRY_RECHECK_SECONDS = 3600  # Retry interval for jobs still running at expiry
 _cleanup_thread: threading.Thread | None = None  # Background cleanup thread
 _shutdown_event = threading.Event()  # Graceful shutdown signal
 
+# Per-job working directories live under these, resolved once against the
+# directory the service was started from
+_PROJECT_ROOT = Path.cwd()
+_UPLOADS_DIR = _PROJECT_ROOT / "uploads"
+_OUTPUTS_DIR = _PROJECT_ROOT / "outputs"
+
+# Uploads are copied to disk in fixed-size chunks so that a MAX_FILE_SIZE
+# upload is never held in memory in full.
+_UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+_UPLOAD_HEADER_SIZE = 4096  # Leading bytes checked by _validate_file_content
+_INVALID_CONTENT_DETAIL = "Invalid file content or potential security risk"
+_EXTRACT_CHUNK_SIZE = 1024 * 1024  # Copy buffer for archive members
+# Read buffer for tar archives, whose 512-byte headers would otherwise be
+# fetched a few at a time with the default buffer
+_TAR_READ_BUFFER_SIZE = 64 * 1024
+# Threads extracting ZIP members concurrently; each opens its own ZipFile
+_EXTRACT_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Markup that has no business in a LaTeX project upload. All patterns are
+# compiled into one case-insensitive regex so content is scanned in a single
+# pass without building a lower-cased copy.
+_SUSPICIOUS_PATTERNS: tuple[bytes, ...] = (
+    b"<script",
+    b"javascript:",
+    b"vbscript:",
+    b"data:text/html",
+    b"<iframe",
+    b"<object",
+    b"<embed",
+)
+_SUSPICIOUS_CONTENT_RE = re.compile(
+    b"|".join(re.escape(pattern) for pattern in _SUSPICIOUS_PATTERNS),
+    re.IGNORECASE,
+)
+# Bytes carried over between chunks of an upload or extracted source so that
+# a pattern straddling a chunk boundary is still found
+_SUSPICIOUS_OVERLAP = max(len(pattern) for pattern in _SUSPICIOUS_PATTERNS) - 1
+# Compressed uploads cannot contain the patterns verbatim, so they are not
+# scanned as raw bytes. Their extracted text sources are scanned instead.
+# Keys are os.path.splitext() suffixes, so multi-part ones like ".tar.gz"
+# can never match here.
+_COMPRESSED_ARCHIVE_EXTENSIONS = frozenset({".zip"})
+_SCANNED_SOURCE_SUFFIXES = (".tex", ".bib", ".sty", ".cls", ".svg")
+
+# Conventional main LaTeX file names, in order of preference
+_MAIN_TEX_CANDIDATES: tuple[str, ...] = (
+    "main.tex",
+    "document.tex",
+    "paper.tex",
+    "article.tex",
+    "thesis.tex",
+    "report.tex",
+    "manuscript.tex",
+    "finalmanuscript.tex",
+)
+_MAIN_TEX_CANDIDATE_SET = frozenset(_MAIN_TEX_CANDIDATES)
+# Tool and archiver metadata directories that never hold the main LaTeX file.
+# Hidden directories (".git", ...) are skipped as well.
+_NON_SOURCE_DIRS = frozenset({"__MACOSX", "__pycache__", "_minted", "node_modules"})
+
+# Result HTML locations relative to the output directory, in priority order
+_RESULT_HTML_CANDIDATES = ("final.html", "latexml/main.html")
+# Image/figure formats packaged with the conversion results
+_RESULT_ASSET_SUFFIXES = frozenset(
+    {".svg", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".pdf"}
+)
+# Asset formats that are already compressed and are stored in result ZIPs as-is
+_PRECOMPRESSED_SUFFIXES = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".webp", ".pdf"}
+)
+# Result files up to this size are compressed from one in-memory buffer
+_ZIP_SMALL_ENTRY_SIZE = 256 * 1024  # 256 KiB
+
+# Orchestrator job status -> API status
+_STATUS_MAPPING: Mapping[ConversionStatusEnum, ConversionStatus] = MappingProxyType(
+    {
+        ConversionStatusEnum.PENDING: ConversionStatus.PENDING,
+        ConversionStatusEnum.RUNNING: ConversionStatus.PROCESSING,
+        ConversionStatusEnum.COMPLETED: ConversionStatus.COMPLETED,
+        ConversionStatusEnum.FAILED: ConversionStatus.FAILED,
+        ConversionStatusEnum.CANCELLED: ConversionStatus.CANCELLED,
+    }
+)
+
+# Job states after which the output directory no longer changes
+_TERMINAL_STATUSES = frozenset(
+    {
+        ConversionStatusEnum.COMPLETED,
+        ConversionStatusEnum.FAILED,
+        ConversionStatusEnum.CANCELLED,
+    }
+)
+
 
 # ============================================================================
 # Helper Functions - Thread-Safe Storage Operations
 # ============================================================================
 
 
+_StorageShard = tuple[OrderedDict[str, dict[str, Any]], threading.Lock]
+
+
+class _ShardedConversionStore:
+    """
+    Conversion metadata map split into independently locked shards.
+
+    A key always maps to the same shard, so operations on conversions in
+    different shards never wait for each other. Plain (non-reentrant)
+    locks are used because no operation re-enters the store.
+    """
+
+    def __init__(self, shard_count: int, max_entries: int | None = None) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            shard_count: Number of shards; must be a power of two so the
+                shard index can be taken with a bit mask
+            max_entries: Total number of entries above which the oldest
+                finished entries are evicted (None = unbounded)
+        """
+        if shard_count <= 0 or shard_count & (shard_count - 1):
+            raise ValueError(f"shard_count must be a power of two: {shard_count}")
+        self._mask = shard_count - 1
+        self.max_entries = max_entries
+        self._shards: list[_StorageShard] = [
+            (OrderedDict(), threading.Lock()) for _ in range(shard_count)
+        ]
+
+    def shard_for(self, conversion_id: str) -> _StorageShard:
+        """
+        Get the shard dict and lock responsible for a conversion ID.
+
+        Args:
+            conversion_id: Conversion ID to look up
+
+        Returns:
+            Tuple of the shard dict and the lock guarding it
+        """
+        return self._shards[hash(conversion_id) & self._mask]
+
+    def shards(self) -> list[_StorageShard]:
+        """
+        Get all shards, for callers that visit the store one shard at a time.
+
+        Returns:
+            List of (shard dict, lock) tuples
+        """
+        return self._shards
+
+    def __len__(self) -> int:
+        """Total number of entries across all shards (may be slightly stale)."""
+        return sum(len(shard) for shard, _ in self._shards)
+
+
+_conversion_store = _ShardedConversionStore(
+    _STORAGE_SHARD_COUNT, settings.MAX_TRACKED_CONVERSIONS
+)
+
+
 def _safe_get_conversion(conversion_id: str) -> dict[str, Any] | None:
     """
     Thread-safe get conversion data.
 
+    Reads take no lock: a single ``get`` on the shard is atomic under the
+    GIL, and the returned entry was never protected by the lock anyway.
+    This keeps status polling off the shard locks entirely.
+
     Args:
         conversion_id: Conversion ID to retrieve
 
     Returns:
         Conversion data or None if not found
     """
-    with _storage_lock:
-        return _conversion_storage.get(conversion_id)
+    shard, _ = _conversion_store.shard_for(conversion_id)
+    return shard.get(conversion_id)
 
 
 def _safe_set_conversion(conversion_id: str, data: dict[str, Any]) -> None:
@@ -90,8 +282,27 @@ def _safe_set_conversion(conversion_id: str, data: dict[str, Any]) -> None:
         conversion_id: Conversion ID to store
         data: Conversion data to store
     """
-    with _storage_lock:
-        _conversion_storage[conversion_id] = data
+    shard, lock = _conversion_store.shard_for(conversion_id)
+    with lock:
+        shard[conversion_id] = data
+        shard.move_to_end(conversion_id)
+
+    _schedule_conversion_expiry(
+        conversion_id,
+        data.get("created_at_ts", time.time())
+        + settings.CONVERSION_RETENTION_HOURS * 3600,
+    )
+
+    max_entries = _conversion_store.max_entries
+    if (
+        max_entries is not None
+        and len(_conversion_store) > max_entries
+        and not _eviction_requested.is_set()
+    ):
+        # Evict on the cleanup thread, which looks up job statuses first
+        with _expiry_cv:
+            _eviction_requested.set()
+            _expiry_cv.notify()
 
 
 def _safe_remove_conversion(conversion_id: str) -> dict[str, Any] | None:
@@ -104,8 +315,9 @@ def _safe_remove_conversion(conversion_id: str) -> dict[str, Any] | None:
     Returns:
         Removed conversion data or None if not found
     """
-    with _storage_lock:
-        return _conversion_storage.pop(conversion_id, None)
+    shard, lock = _conversion_store.shard_for(conversion_id)
+    with lock:
+        return shard.pop(conversion_id, None)
 
 
 def _safe_update_conversion(conversion_id: str, updates: dict[str, Any]) -> bool:
@@ -119,73 +331,189 @@ def _safe_update_conversion(conversion_id: str, updates: dict[str, Any]) -> bool
     Returns:
         True if conversion existed and was updated, False otherwise
     """
-    with _storage_lock:
-        if conversion_id in _conversion_storage:
-            _conversion_storage[conversion_id].update(updates)
+    shard, lock = _conversion_store.shard_for(conversion_id)
+    with lock:
+        if conversion_id in shard:
+            shard[conversion_id].update(updates)
             return True
         return False
 
 
-def _cleanup_old_conversions() -> int:
+def _safe_list_conversion_ids() -> list[str]:
     """
-    Clean up old conversion entries from storage.
+    Thread-safe snapshot of all stored conversion IDs.
+
+    Each shard is locked only while its keys are copied.
 
     Returns:
-        Number of entries cleaned up
+        List of conversion IDs
     """
-    cutoff_time = datetime.utcnow() - timedelta(
-        hours=settings.CONVERSION_RETENTION_HOURS
-    )
-    cleaned_count = 0
+    conversion_ids: list[str] = []
+    for shard, lock in _conversion_store.shards():
+        with lock:
+            conversion_ids.extend(shard)
+    return conversion_ids
 
-    with _storage_lock:
-        conversions_to_remove = []
-        orchestrator = get_orchestrator()
 
-        for conv_id, conv_data in _conversion_storage.items():
-            # Get job status from orchestrator
-            status = orchestrator.get_job_status(conv_id)
-
-            # Remove if job is completed/failed and old, or if job no longer exists
-            if status is None or status in [
-                ConversionStatusEnum.COMPLETED,
-                ConversionStatusEnum.FAILED,
-                ConversionStatusEnum.CANCELLED,
-            ]:
-                # Check if we have a timestamp
-                created_at_str = conv_data.get("created_at")
-                if created_at_str:
-                    try:
-                        created_at = (
-                            datetime.fromisoformat(created_at_str)
-                            if isinstance(created_at_str, str)
-                            else created_at_str
-                        )
-                        if created_at < cutoff_time:
-                            conversions_to_remove.append(conv_id)
-                    except (ValueError, TypeError):
-                        # If timestamp parsing fails, remove it anyway
-                        conversions_to_remove.append(conv_id)
-                else:
-                    # No timestamp, remove it
-                    conversions_to_remove.append(conv_id)
-
-        for conv_id in conversions_to_remove:
-            conv_data = _conversion_storage.pop(conv_id, None)
-            if conv_data:
-                # Clean up directories
-                for dir_key in ["upload_dir", "output_dir", "temp_dir"]:
-                    if dir_key in conv_data:
-                        dir_path = Path(conv_data[dir_key])
-                        if dir_path.exists():
-                            try:
-                                shutil.rmtree(dir_path, ignore_errors=True)
-                                logger.debug(f"Cleaned up directory: {dir_path}")
-                            except Exception as exc:
-                                logger.warning(
-                                    f"Failed to clean up directory {dir_path}: {exc}"
-                                )
-                cleaned_count += 1
+def _schedule_conversion_expiry(conversion_id: str, expires_at: float) -> None:
+    """
+    Schedule a conversion entry to be checked for cleanup.
+
+    Args:
+        conversion_id: Conversion ID to check
+        expires_at: Unix timestamp at which the entry becomes due
+    """
+    with _expiry_cv:
+        heapq.heappush(_expiry_heap, (expires_at, conversion_id))
+        # Only a new earliest deadline changes how long the loop should sleep
+        if _expiry_heap[0] == (expires_at, conversion_id):
+            _expiry_cv.notify()
+
+
+def _is_conversion_expired(
+    status: ConversionStatusEnum | None,
+    conv_data: dict[str, Any],
+    cutoff_ts: float,
+) -> bool:
+    """
+    Check whether a conversion entry is past retention and may be removed.
+
+    Args:
+        status: Orchestrator job status (None if the job is unknown)
+        conv_data: Stored conversion data
+        cutoff_ts: Entries created before this Unix timestamp are expired
+
+    Returns:
+        bool: True if the entry should be removed
+    """
+    # Keep jobs that are still pending or running
+    if status is not None and status not in _TERMINAL_STATUSES:
+        return False
+
+    # Entries without a creation timestamp are removed
+    created_at_ts = conv_data.get("created_at_ts")
+    return created_at_ts is None or created_at_ts < cutoff_ts
+
+
+def _evict_excess_conversions() -> list[dict[str, Any]]:
+    """
+    Evict the oldest finished entries until the store is back within
+    MAX_TRACKED_CONVERSIONS.
+
+    This keeps memory bounded at the cost of retention: while the store is
+    full, a finished result can be dropped before CONVERSION_RETENTION_HOURS
+    has passed. Pending and running jobs are never evicted, and neither are
+    entries the orchestrator does not know yet (a job that is still being
+    started), so the store may stay over the limit while that many jobs
+    are active.
+
+    Returns:
+        Data of the evicted entries
+    """
+    max_entries = _conversion_store.max_entries
+    if max_entries is None:
+        return []
+    excess = len(_conversion_store) - max_entries
+    if excess <= 0:
+        return []
+
+    # Order every entry by age; each shard is locked only while it is copied
+    entries: list[tuple[float, str]] = []
+    for shard, lock in _conversion_store.shards():
+        with lock:
+            entries.extend(
+                (conv_data.get("created_at_ts") or 0.0, conv_id)
+                for conv_id, conv_data in shard.items()
+            )
+    entries.sort()
+
+    cutoff_ts = time.time() - settings.CONVERSION_RETENTION_HOURS * 3600
+    evicted: list[dict[str, Any]] = []
+    for start in range(0, len(entries), _EVICTION_BATCH_SIZE):
+        batch = [
+            conv_id for _, conv_id in entries[start : start + _EVICTION_BATCH_SIZE]
+        ]
+        statuses = get_orchestrator().get_job_statuses(batch)
+        for conv_id in batch:
+            status = statuses.get(conv_id)
+            shard, lock = _conversion_store.shard_for(conv_id)
+            with lock:
+                conv_data = shard.get(conv_id)
+                if conv_data is None:
+                    continue
+                if status in _TERMINAL_STATUSES or _is_conversion_expired(
+                    status, conv_data, cutoff_ts
+                ):
+                    evicted.append(shard.pop(conv_id))
+                    excess -= 1
+            if excess <= 0:
+                return evicted
+
+    return evicted
+
+
+def _cleanup_old_conversions(conversion_ids: list[str]) -> int:
+    """
+    Clean up the given conversion entries if they are past retention, and
+    evict the oldest finished entries if the store is over its limit.
+
+    Due entries are removed only once their job has finished; those that
+    are not yet removable are rescheduled for a later check.
+
+    Args:
+        conversion_ids: Conversion IDs whose expiry time has been reached
+
+    Returns:
+        Number of entries cleaned up
+    """
+    cutoff_ts = time.time() - settings.CONVERSION_RETENTION_HOURS * 3600
+    removed_conversions: list[dict[str, Any]] = []
+    recheck_ids: list[str] = []
+
+    # Look up every job in one batch before touching the store, so the
+    # orchestrator's lock is never taken while a shard lock is held. A job
+    # seen as finished here cannot become active again, so the snapshot is
+    # safe to act on.
+    statuses = get_orchestrator().get_job_statuses(conversion_ids)
+
+    # Lock only the shard of each entry, and only briefly
+    for conv_id in conversion_ids:
+        status = statuses.get(conv_id)
+        shard, lock = _conversion_store.shard_for(conv_id)
+        with lock:
+            conv_data = shard.get(conv_id)
+            if conv_data is None:
+                # Already removed or evicted
+                continue
+            if _is_conversion_expired(status, conv_data, cutoff_ts):
+                removed_conversions.append(shard.pop(conv_id))
+            else:
+                recheck_ids.append(conv_id)
+
+    recheck_at = time.time() + _EXPIRY_RECHECK_SECONDS
+    for conv_id in recheck_ids:
+        _schedule_conversion_expiry(conv_id, recheck_at)
+
+    # Clear the request first so a set that lands during the pass asks again
+    if _eviction_requested.is_set():
+        _eviction_requested.clear()
+        removed_conversions.extend(_evict_excess_conversions())
+
+    # Remove directories outside the locks so API requests are not blocked
+    # behind slow filesystem work, batching every doomed tree into one call
+    doomed_dirs = [
+        Path(conv_data[dir_key])
+        for conv_data in removed_conversions
+        for dir_key in ("upload_dir", "output_dir", "temp_dir")
+        if dir_key in conv_data
+    ]
+    cleaned_count = len(removed_conversions)
+    if doomed_dirs:
+        try:
+            remove_directories(*doomed_dirs)
+            logger.debug(f"Cleaned up {len(doomed_dirs)} directories")
+        except Exception as exc:
+            logger.warning(f"Failed to clean up conversion directories: {exc}")
 
     if cleaned_count > 0:
         logger.info(f"Cleaned up {cleaned_count} old conversion entries")
@@ -193,13 +521,36 @@ def _cleanup_old_conversions() -> int:
     return cleaned_count
 
 
+def _wait_for_due_conversions() -> list[str]:
+    """
+    Sleep until the earliest scheduled expiry, an eviction request, or
+    shutdown.
+
+    Returns:
+        Conversion IDs whose expiry time has been reached
+    """
+    with _expiry_cv:
+        while not _shutdown_event.is_set() and not _eviction_requested.is_set():
+            now = time.time()
+            if _expiry_heap and _expiry_heap[0][0] <= now:
+                break
+            # Nothing scheduled means nothing to do until woken
+            _expiry_cv.wait(_expiry_heap[0][0] - now if _expiry_heap else None)
+
+        now = time.time()
+        due_ids: list[str] = []
+        while _expiry_heap and _expiry_heap[0][0] <= now:
+            due_ids.append(heapq.heappop(_expiry_heap)[1])
+        return due_ids
+
+
 def _cleanup_loop() -> None:
-    """Background cleanup loop for old conversions."""
+    """Background cleanup loop, woken only when conversions become due."""
     while not _shutdown_event.is_set():
         try:
-            _cleanup_old_conversions()
-            # Wait for 1 hour or until shutdown
-            _shutdown_event.wait(3600)
+            due_ids = _wait_for_due_conversions()
+            if due_ids or _eviction_requested.is_set():
+                _cleanup_old_conversions(due_ids)
         except Exception as exc:
             logger.error(f"Error in cleanup loop: {exc}")
             _shutdown_event.wait(60)  # Wait 1 minute before retrying
@@ -222,12 +573,111 @@ def stop_cleanup_thread() -> None:
     global _cleanup_thread
 
     _shutdown_event.set()
+    with _expiry_cv:
+        _expiry_cv.notify_all()
 
     if _cleanup_thread and _cleanup_thread.is_alive():
         _cleanup_thread.join(timeout=5.0)
         logger.info("Stopped conversion storage cleanup thread")
 
 
+def _collect_result_files(output_dir: Path) -> tuple[list[Path], list[Path]]:
+    """
+    Collect stylesheet and asset files from an output directory in one walk.
+
+    Args:
+        output_dir: Output directory containing results
+
+    Returns:
+        tuple: (CSS files, image/figure asset files)
+    """
+    css_files: list[Path] = []
+    asset_files: list[Path] = []
+
+    pending = [str(output_dir)]
+    while pending:
+        current_dir = pending.pop()
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    suffix = os.path.splitext(entry.name)[1].lower()
+                    if suffix == ".css":
+                        css_files.append(Path(entry.path))
+                    elif suffix in _RESULT_ASSET_SUFFIXES:
+                        asset_files.append(Path(entry.path))
+        except OSError as exc:
+            logger.warning(f"Failed to scan {current_dir}: {exc}")
+
+    return css_files, asset_files
+
+
+def _add_zip_entry(
+    zipf: zipfile.ZipFile,
+    file_path: Path,
+    arcname: str | Path,
+    compress_type: int | None = None,
+) -> None:
+    """
+    Add a file to a ZIP archive.
+
+    Small files are read whole and compressed in a single call; larger
+    files go through zipfile's streaming writer.
+
+    Args:
+        zipf: Archive open for writing
+        file_path: File to add
+        arcname: Name of the entry inside the archive
+        compress_type: Compression override (None = archive default)
+    """
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    if zinfo.file_size > _ZIP_SMALL_ENTRY_SIZE:
+        zipf.write(file_path, arcname, compress_type=compress_type)
+        return
+
+    zinfo.compress_type = (
+        compress_type if compress_type is not None else zipf.compression
+    )
+    zipf.writestr(zinfo, file_path.read_bytes(), compresslevel=zipf.compresslevel)
+
+
+def _is_result_zip_fresh(output_dir: Path, output_zip: Path) -> bool:
+    """
+    Check whether a previously built result ZIP is newer than every file in
+    the output directory.
+
+    Args:
+        output_dir: Output directory containing results
+        output_zip: Path of the result ZIP
+
+    Returns:
+        bool: True if the ZIP exists and no output file is newer
+    """
+    try:
+        zip_mtime = output_zip.stat().st_mtime
+    except OSError:
+        return False
+
+    pending = [str(output_dir)]
+    while pending:
+        current_dir = pending.pop()
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.path != str(output_zip) and (
+                        entry.stat().st_mtime > zip_mtime
+                    ):
+                        return False
+        except OSError:
+            return False
+
+    return True
+
+
 def _create_result_zip(output_dir: Path, output_zip: Path) -> None:
     """
     Create a ZIP file containing the conversion results.
@@ -236,73 +686,117 @@ def _create_result_zip(output_dir: Path, output_zip: Path) -> None:
         output_dir: Output directory containing results
         output_zip: Path for the output ZIP file
     """
-    import zipfile
-
     try:
-        with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Add HTML file - check for final.html first,
-            # then look in latexml subdirectory
-            html_file = output_dir / "final.html"
-            html_in_latexml = False
-            if not html_file.exists():
-                # Check in latexml subdirectory
-                latexml_html = output_dir / "latexml" / "main.html"
-                if latexml_html.exists():
-                    html_file = latexml_html
-                    html_in_latexml = True
-
-            if html_file.exists():
-                # Preserve directory structure: if HTML is in latexml/,
-                # add it as latexml/main.html
-                # This ensures image paths in the HTML (like figures/fig.svg)
-                # match the ZIP structure
-                if html_in_latexml:
-                    zipf.write(html_file, html_file.relative_to(output_dir))
-                else:
-                    # final.html goes to root of ZIP
-                    zipf.write(html_file, html_file.name)
-
-            # Add CSS files
-            css_patterns = ["*.css"]
-            for pattern in css_patterns:
-                for css_file in output_dir.rglob(pattern):
-                    if css_file != output_zip:
-                        zipf.write(css_file, css_file.relative_to(output_dir))
+        # Text outputs (HTML, CSS, SVG) compress nearly as well at level 1
+        # as at the default level 6, for a fraction of the CPU time
+        with zipfile.ZipFile(
+            output_zip, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zipf:
+            # Add HTML file - final.html first, then the latexml output.
+            # Its path inside the ZIP matches the one on disk, so image paths
+            # in the HTML (like figures/fig.svg) still resolve. Adding the
+            # entry stats the file anyway, so a missing candidate is detected
+            # there instead of with a separate exists() check.
+            for html_relpath in _RESULT_HTML_CANDIDATES:
+                try:
+                    _add_zip_entry(zipf, output_dir / html_relpath, html_relpath)
+                except FileNotFoundError:
+                    continue
+                break
 
-            # Add all image/figure formats
+            # Add CSS and image/figure files found in a single walk
             # Preserve relative paths to maintain directory structure
-            image_patterns = [
-                "*.svg",
-                "*.png",
-                "*.jpg",
-                "*.jpeg",
-                "*.gif",
-                "*.webp",
-                "*.pdf",
-            ]
-            for pattern in image_patterns:
-                for asset_file in output_dir.rglob(pattern):
-                    if asset_file != output_zip and asset_file != html_file:
-                        zipf.write(asset_file, asset_file.relative_to(output_dir))
-
-        logger.info(f"Created result ZIP: {output_zip}")
+            css_files, asset_files = _collect_result_files(output_dir)
+            for css_file in css_files:
+                _add_zip_entry(zipf, css_file, css_file.relative_to(output_dir))
+
+            for asset_file in asset_files:
+                # Already-compressed images and PDFs gain nothing from deflate
+                compress_type = (
+                    zipfile.ZIP_STORED
+                    if asset_file.suffix.lower() in _PRECOMPRESSED_SUFFIXES
+                    else None
+                )
+                _add_zip_entry(
+                    zipf,
+                    asset_file,
+                    asset_file.relative_to(output_dir),
+                    compress_type=compress_type,
+                )
+
+        logger.info("Created result ZIP: {}", output_zip)
     except Exception as exc:
         logger.error(f"Failed to create result ZIP: {exc}")
         raise
 
 
-def _cleanup_temp_directory(temp_dir: Path) -> None:
+def _replace_result_zip(output_dir: Path, output_zip: Path) -> None:
+    """
+    Build the result ZIP under a temporary name and move it into place.
+
+    A concurrent download therefore never serves a partially written
+    archive, and concurrent builds never write into the same file.
+
+    Args:
+        output_dir: Output directory containing results
+        output_zip: Final path of the result ZIP
+    """
+    partial_zip = output_zip.with_name(
+        f"{output_zip.name}.{secrets.token_hex(4)}.tmp"
+    )
+    try:
+        _create_result_zip(output_dir, partial_zip)
+        os.replace(partial_zip, output_zip)
+    except BaseException:
+        partial_zip.unlink(missing_ok=True)
+        raise
+
+
+def _prebuild_result_zip(job: ConversionJob) -> None:
     """
-    Clean up temporary directory.
+    Build the result ZIP of a completed job ahead of the first download.
+
+    Runs on the orchestrator's conversion thread.
 
     Args:
-        temp_dir: Temporary directory to clean up
+        job: Finished conversion job
     """
+    if job.status != ConversionStatusEnum.COMPLETED:
+        return
+
+    output_dir = Path(job.output_dir)
+    output_zip = output_dir / f"{job.job_id}_result.zip"
     try:
-        shutil.rmtree(temp_dir, ignore_errors=True)
-        logger.info(f"Cleaned up temporary directory: {temp_dir}")
+        _replace_result_zip(output_dir, output_zip)
     except Exception as exc:
-        logger.error(f"Failed to clean up temporary directory {temp_dir}: {exc}")
+        logger.warning(f"Failed to prebuild result ZIP for {job.job_id}: {exc}")
+        return
+
+    _safe_update_conversion(job.job_id, {"result_zip": str(output_zip)})
+
+
+def _make_job_dir(base_dir: Path, name: str) -> Path:
+    """
+    Create a job's working directory under base_dir.
+
+    Job IDs are unique, so the directory is created without an existence
+    check; base_dir itself is only created when it turns out to be missing.
+
+    Args:
+        base_dir: Uploads or outputs directory
+        name: Job directory name
+
+    Returns:
+        Path: The created directory
+    """
+    job_dir = base_dir / name
+    try:
+        job_dir.mkdir()
+    except FileNotFoundError:
+        # First job since start-up, or the base directory was removed
+        base_dir.mkdir(parents=True, exist_ok=True)
+        job_dir.mkdir()
+    return job_dir
 
 
 @router.post("/convert", response_model=ConversionResponse)
@@ -354,23 +848,13 @@ async def convert_latex_to_html(
                 ),
             )
 
-        # Read file content
-        file_content = await file.read()
-
-        # Check file size
-        if len(file_content) > settings.MAX_FILE_SIZE:
+        # Reject oversized uploads early when the multipart parser knows the size
+        if file.size is not None and file.size > settings.MAX_FILE_SIZE:
             raise HTTPException(
                 status_code=413,
                 detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE} bytes",
             )
 
-        # Validate file content (basic security check)
-        if not _validate_file_content(file_content, file_ext):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file content or potential security risk",
-            )
-
         # Parse conversion options
         request_options_dict = _parse_conversion_options(options)
 
@@ -387,51 +871,45 @@ async def convert_latex_to_html(
 
         # Check disk space before processing
         # Estimate required space: 3x file size for extraction + processing
-        required_space_mb = (len(file_content) * 3) / (1024 * 1024)
+        upload_size = file.size if file.size is not None else settings.MAX_FILE_SIZE
+        required_space_mb = (upload_size * 3) / (1024 * 1024)
         required_space_mb = max(required_space_mb, 100)  # Minimum 100 MB
 
         try:
-            ensure_sufficient_disk_space(Path.cwd(), int(required_space_mb))
+            ensure_sufficient_disk_space(_PROJECT_ROOT, int(required_space_mb))
         except OSError as exc:
             raise HTTPException(
                 status_code=507,  # Insufficient Storage
                 detail=f"Insufficient disk space: {exc}",
             ) from exc
 
-        # Create organized directory structure
-        project_root = Path.cwd()
-        uploads_dir = project_root / "uploads"
-        outputs_dir = project_root / "outputs"
-
-        # Create base directories if they don't exist
-        uploads_dir.mkdir(exist_ok=True)
-        outputs_dir.mkdir(exist_ok=True)
-
-        # Generate unique job ID and create job-specific directories
-        job_id = str(uuid.uuid4())
+        # Generate unique job ID (128 random bits, 22 URL-safe characters)
+        # and create job-specific directories
+        job_id = secrets.token_urlsafe(16)
         zip_name = file.filename.rsplit(".", 1)[0]  # Remove extension
 
         # Create job directories
-        job_upload_dir = uploads_dir / job_id
-        job_output_dir = outputs_dir / f"{zip_name}_{job_id}"
-
-        job_upload_dir.mkdir(exist_ok=True)
-        job_output_dir.mkdir(exist_ok=True)
+        job_upload_dir = _make_job_dir(_UPLOADS_DIR, job_id)
+        job_output_dir = _make_job_dir(_OUTPUTS_DIR, f"{zip_name}_{job_id}")
 
         try:
-            # Save uploaded file to uploads/job_id/
+            # Stream uploaded file to uploads/job_id/
             input_file = job_upload_dir / file.filename
-            with open(input_file, "wb") as f:
-                f.write(file_content)
+            await _save_upload_file(file, input_file, file_ext)
 
-            logger.info(f"Saved upload to: {input_file}")
+            logger.info("Saved upload to: {}", input_file)
 
-            # Extract archive in upload directory
-            extracted_dir = _extract_archive(input_file, job_upload_dir)
-            logger.info(f"Extracted archive to: {extracted_dir}")
+            # Extract archive in upload directory without blocking the event loop
+            extracted_dir = await asyncio.to_thread(
+                _extract_archive, input_file, job_upload_dir
+            )
+            logger.info("Extracted archive to: {}", extracted_dir)
 
-            # Find main LaTeX file
-            main_tex_file = _find_main_tex_file(extracted_dir)
+            # Find main LaTeX file, measure the project and scan the text
+            # sources in a single walk
+            main_tex_file, total_size, file_count = await asyncio.to_thread(
+                _scan_extracted_dir, extracted_dir
+            )
             if not main_tex_file:
                 raise HTTPException(
                     status_code=400, detail="No main LaTeX file found in archive"
@@ -439,11 +917,11 @@ async def convert_latex_to_html(
 
             # Calculate adaptive timeout based on extracted directory (not just .tex file)
             # This ensures large projects get appropriate timeouts
-            from app.services.pipeline import ConversionPipeline
             pipeline = ConversionPipeline()
-            calculated_timeout = pipeline._calculate_adaptive_timeout(extracted_dir)
+            calculated_timeout = pipeline._timeout_for_metrics(total_size, file_count)
             logger.info(
-                f"Calculated adaptive timeout based on extracted directory: {calculated_timeout}s"
+                "Calculated adaptive timeout based on extracted directory: {}s",
+                calculated_timeout,
             )
             
             # Override timeout in options if not already set
@@ -451,40 +929,52 @@ async def convert_latex_to_html(
                 conversion_options = ConversionOptions()
             if not hasattr(conversion_options, "max_processing_time") or conversion_options.max_processing_time is None:
                 conversion_options.max_processing_time = calculated_timeout
-                logger.info(f"Set max_processing_time to {calculated_timeout}s based on extracted directory size")
+                logger.info(
+                    "Set max_processing_time to {}s based on extracted directory size",
+                    calculated_timeout,
+                )
 
             # Output goes to outputs/zip_name_job_id/
             output_dir = job_output_dir
-            logger.info(f"Output will be saved to: {output_dir}")
+            logger.info("Output will be saved to: {}", output_dir)
 
             # Get orchestrator and start conversion
             logger.info("Getting orchestrator...")
             orchestrator = get_orchestrator()
             logger.info("Orchestrator obtained successfully")
 
+            # Read the clock once: the Unix timestamp drives retention,
+            # the ISO string is shown in the storage entry and report
+            started_ts = time.time()
+            started_at = datetime.utcfromtimestamp(started_ts).isoformat()
+
+            # Initialize conversion storage entry with directory paths for
+            # later retrieval. It must exist before the job starts, since the
+            # on_complete callback records the prebuilt result ZIP in it.
+            _safe_set_conversion(
+                job_id,
+                {
+                    "upload_dir": str(job_upload_dir),
+                    "output_dir": str(job_output_dir),
+                    "zip_name": zip_name,
+                    "created_at": started_at,
+                    "created_at_ts": started_ts,
+                },
+            )
+
             try:
-                logger.info(f"Starting conversion: {main_tex_file} -> {output_dir}")
+                logger.info("Starting conversion: {} -> {}", main_tex_file, output_dir)
                 conversion_job_id = orchestrator.start_conversion(
                     input_file=main_tex_file,
                     output_dir=output_dir,
                     options=conversion_options,
                     # Use the same job_id for folder naming and conversion tracking
                     job_id=job_id,
+                    # Have the download archive ready before it is requested
+                    on_complete=_prebuild_result_zip,
                 )
 
-                # Initialize conversion storage entry with directory paths
-                # for later retrieval
-                _safe_set_conversion(
-                    conversion_job_id,
-                    {
-                        "upload_dir": str(job_upload_dir),
-                        "output_dir": str(job_output_dir),
-                        "zip_name": zip_name,
-                        "created_at": datetime.utcnow().isoformat(),
-                    },
-                )
-
-                logger.info(f"Started conversion job: {conversion_job_id}")
+                logger.info("Started conversion job: {}", conversion_job_id)
 
                 # For now, return a pending response
                 # In a real implementation, this would be handled asynchronously
@@ -498,7 +988,7 @@ async def convert_latex_to_html(
                         "missing_macros": [],
                         "packages_used": [],
                         "conversion_time": 0.0,
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": started_at,
                         "options": conversion_options.model_dump()
                         if conversion_options
                         else {},
@@ -508,25 +998,27 @@ async def convert_latex_to_html(
                 return response
 
             except ResourceLimitError as exc:
-                # Cleanup storage entry on resource limit error (if job was created)
-                if "conversion_job_id" in locals():
-                    _safe_remove_conversion(conversion_job_id)
+                # Cleanup storage entry on resource limit error
+                _safe_remove_conversion(job_id)
                 raise HTTPException(
                     status_code=503, detail=f"Service temporarily unavailable: {exc}"
                 ) from exc
             except OrchestrationError as exc:
-                # Cleanup storage entry on orchestration error (if job was created)
-                if "conversion_job_id" in locals():
-                    _safe_remove_conversion(conversion_job_id)
+                # Cleanup storage entry on orchestration error
+                _safe_remove_conversion(job_id)
                 raise HTTPException(
                     status_code=500, detail=f"Conversion failed: {exc}"
                 ) from exc
 
         except Exception as exc:
-            # Cleanup on error - remove job directories
+            # Cleanup on error - remove job directories without blocking the
+            # event loop on the rm subprocess
+            await asyncio.to_thread(
+                remove_directories, job_upload_dir, job_output_dir
+            )
+            if isinstance(exc, HTTPException):
+                raise
             logger.error(f"Error during conversion setup: {exc}")
-            shutil.rmtree(job_upload_dir, ignore_errors=True)
-            shutil.rmtree(job_output_dir, ignore_errors=True)
             raise HTTPException(
                 status_code=500, detail=f"Conversion setup failed: {exc}"
             ) from exc
@@ -551,32 +1043,22 @@ async def list_conversion_jobs() -> dict[str, Any]:
         orchestrator = get_orchestrator()
         job_list = []
 
-        with _storage_lock:
-            conversion_ids = list(_conversion_storage.keys())
+        conversion_ids = _safe_list_conversion_ids()
 
-        # Get status for each job
-        for conversion_id in conversion_ids:
-            try:
-                status = orchestrator.get_job_status(conversion_id)
-                if not status:
-                    continue
+        # Read and format the clock once for the whole listing
+        now_iso = datetime.utcnow().isoformat()
 
-                progress = orchestrator.get_job_progress(conversion_id)
-                job_result = orchestrator.get_job_result(conversion_id)
+        # Fetch status, progress and result for every job in one batch
+        jobs = orchestrator.get_jobs_bulk(conversion_ids)
 
-                created_at = datetime.utcnow()
-                if job_result:
-                    created_at = job_result.created_at
+        for conversion_id, (status, progress, job_result) in jobs.items():
+            try:
+                created_at_iso = (
+                    job_result.created_at.isoformat() if job_result else now_iso
+                )
 
                 # Map orchestrator status to API status
-                status_mapping = {
-                    ConversionStatusEnum.PENDING: ConversionStatus.PENDING,
-                    ConversionStatusEnum.RUNNING: ConversionStatus.PROCESSING,
-                    ConversionStatusEnum.COMPLETED: ConversionStatus.COMPLETED,
-                    ConversionStatusEnum.FAILED: ConversionStatus.FAILED,
-                    ConversionStatusEnum.CANCELLED: ConversionStatus.CANCELLED,
-                }
-                api_status = status_mapping.get(status, ConversionStatus.PENDING)
+                api_status = _STATUS_MAPPING.get(status, ConversionStatus.PENDING)
                 progress_percentage = progress.progress_percentage if progress else 0.0
                 message = (
                     progress.message
@@ -599,8 +1081,8 @@ async def list_conversion_jobs() -> dict[str, Any]:
                         "status": api_status,
                         "progress": int(progress_percentage),
                         "message": message,
-                        "created_at": created_at.isoformat(),
-                        "updated_at": datetime.utcnow().isoformat(),
+                        "created_at": created_at_iso,
+                        "updated_at": now_iso,
                         "error_message": error_message,
                     }
                 )
@@ -611,7 +1093,8 @@ async def list_conversion_jobs() -> dict[str, Any]:
                 continue
 
         # Sort by created_at descending
-        job_list.sort(key=lambda x: x["created_at"], reverse=True)
+        # ISO 8601 strings sort chronologically
+        job_list.sort(key=itemgetter("created_at"), reverse=True)
 
         return {"total": len(job_list), "jobs": job_list}
     except Exception as exc:
@@ -622,15 +1105,24 @@ async def list_conversion_jobs() -> dict[str, Any]:
 
 
 @router.get("/convert/{conversion_id}", response_model=ConversionStatusResponse)
-async def get_conversion_status(conversion_id: str) -> ConversionStatusResponse:
+async def get_conversion_status(
+    conversion_id: str, request: Request, response: Response
+) -> ConversionStatusResponse | Response:
     """
     Get the status of a conversion job using the orchestrator.
 
+    Responses carry a weak ETag derived from the job status and progress.
+    Pollers that send it back in If-None-Match get an empty 304 response
+    while nothing has changed.
+
     Args:
         conversion_id: Unique conversion identifier
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for caching headers)
 
     Returns:
-        ConversionStatusResponse: Conversion status and progress
+        ConversionStatusResponse: Conversion status and progress,
+            or a 304 response if the client's copy is current
 
     Raises:
         HTTPException: 404 if conversion not found, 500 on retrieval failure
@@ -645,23 +1137,28 @@ async def get_conversion_status(conversion_id: str) -> ConversionStatusResponse:
 
         # Get progress information
         progress = orchestrator.get_job_progress(conversion_id)
+        progress_percentage = progress.progress_percentage if progress else 0.0
+
+        # Short-circuit if the client already has this state
+        etag = f'W/"{conversion_id}:{status.value}:{int(progress_percentage)}"'
+        cache_headers = {"ETag": etag}
+        if status in _TERMINAL_STATUSES:
+            # Finished jobs no longer change
+            cache_headers["Cache-Control"] = "public, max-age=3600"
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=cache_headers)
+        response.headers.update(cache_headers)
 
         # Get job details for timestamps
         job_result = orchestrator.get_job_result(conversion_id)
-        created_at = datetime.utcnow()
+        now = datetime.utcnow()
+        created_at = now
         if job_result:
             created_at = job_result.created_at
 
         # Map orchestrator status to API status
-        status_mapping = {
-            ConversionStatusEnum.PENDING: ConversionStatus.PENDING,
-            ConversionStatusEnum.RUNNING: ConversionStatus.PROCESSING,
-            ConversionStatusEnum.COMPLETED: ConversionStatus.COMPLETED,
-            ConversionStatusEnum.FAILED: ConversionStatus.FAILED,
-            ConversionStatusEnum.CANCELLED: ConversionStatus.CANCELLED,
-        }
-        api_status = status_mapping.get(status, ConversionStatus.PENDING)
-        progress_percentage = progress.progress_percentage if progress else 0.0
+        api_status = _STATUS_MAPPING.get(status, ConversionStatus.PENDING)
         message = (
             progress.message
             if progress and progress.message
@@ -688,7 +1185,7 @@ async def get_conversion_status(conversion_id: str) -> ConversionStatusResponse:
             progress=int(progress_percentage),
             message=message,
             created_at=created_at,
-            updated_at=datetime.utcnow(),
+            updated_at=now,
             error_message=error_message,
             diagnostics=diagnostics,
         )
@@ -722,6 +1219,9 @@ async def get_conversion_result(conversion_id: str) -> ConversionResponse:
         # Get conversion result from orchestrator
         result = orchestrator.get_job_result(conversion_id)
 
+        # Read the clock once for every fallback timestamp
+        now = datetime.utcnow()
+
         # Get conversion data from storage for directory paths
         conversion_data = _safe_get_conversion(conversion_id)
         output_dir = None
@@ -731,14 +1231,6 @@ async def get_conversion_result(conversion_id: str) -> ConversionResponse:
         # If conversion is completed, get the actual files
         html_file_path = ""
         assets_list = []
-        report_data = {
-            "score": 0.0,
-            "missing_macros": [],
-            "packages_used": [],
-            "conversion_time": 0.0,
-            "timestamp": datetime.utcnow().isoformat(),
-            "options": {},
-        }
 
         if status == ConversionStatusEnum.COMPLETED and result:
             # Get HTML file path - use getattr to avoid type checker issues
@@ -759,16 +1251,12 @@ async def get_conversion_result(conversion_id: str) -> ConversionResponse:
             if result.assets:
                 assets_list = [str(asset) for asset in result.assets if asset.exists()]
             elif output_dir:
-                # Fallback: find assets in output directory
-                # - more efficient pattern matching
-                assets_list = []
-                for pattern in ["*.svg", "*.png", "*.jpg"]:
-                    assets_list.extend(str(f) for f in output_dir.glob(pattern))
-                # Alternative: use rglob with pattern matching
-                # assets_list = [
-                #     str(f) for f in output_dir.rglob("*")
-                #     if f.suffix.lower() in {'.svg', '.png', '.jpg'}
-                # ]
+                # Fallback: find assets in output directory with the same
+                # single walk used to package the results
+                _, asset_files = await asyncio.to_thread(
+                    _collect_result_files, output_dir
+                )
+                assets_list = [str(asset_file) for asset_file in asset_files]
 
             # Build report from result - use getattr to avoid type checker issues
             metadata_dict = getattr(result, "metadata", {})
@@ -785,31 +1273,34 @@ async def get_conversion_result(conversion_id: str) -> ConversionResponse:
                 "conversion_time": result.total_duration_seconds or 0.0,
                 "timestamp": completed_at_dt.isoformat()
                 if completed_at_dt
-                else datetime.utcnow().isoformat(),
+                else now.isoformat(),
                 "options": metadata_dict.get("options", {}),
                 "warnings": result.warnings or [],
                 "stages_completed": result.stages_completed or [],
             }
+        else:
+            # Placeholder report until the job has completed
+            report_data = {
+                "score": 0.0,
+                "missing_macros": [],
+                "packages_used": [],
+                "conversion_time": 0.0,
+                "timestamp": now.isoformat(),
+                "options": {},
+            }
 
         # Map orchestrator status to API status
-        status_mapping = {
-            ConversionStatusEnum.PENDING: ConversionStatus.PENDING,
-            ConversionStatusEnum.RUNNING: ConversionStatus.PROCESSING,
-            ConversionStatusEnum.COMPLETED: ConversionStatus.COMPLETED,
-            ConversionStatusEnum.FAILED: ConversionStatus.FAILED,
-            ConversionStatusEnum.CANCELLED: ConversionStatus.CANCELLED,
-        }
-        api_status = status_mapping.get(status, ConversionStatus.PENDING)
+        api_status = _STATUS_MAPPING.get(status, ConversionStatus.PENDING)
 
         # Get creation and completion times
-        created_at = datetime.utcnow()
+        created_at = now
         completed_at = None
         error_message = None
 
         if result:
-            created_at = getattr(result, "created_at", datetime.utcnow())
+            created_at = getattr(result, "created_at", now)
             if not isinstance(created_at, datetime):
-                created_at = datetime.utcnow()
+                created_at = now
             completed_at = getattr(result, "completed_at", None)
             if not isinstance(completed_at, datetime) and completed_at is not None:
                 completed_at = None
@@ -872,8 +1363,9 @@ async def get_conversion_summary(conversion_id: str) -> ConversionSummaryRespons
         if conversion_data and "output_dir" in conversion_data:
             output_dir = Path(conversion_data["output_dir"])
 
-        # Initialize response data
-        created_at = datetime.utcnow()
+        # Initialize response data (reading the clock once)
+        now = datetime.utcnow()
+        created_at = now
         completed_at = None
         conversion_time = None
         quality_score = None
@@ -886,9 +1378,9 @@ async def get_conversion_summary(conversion_id: str) -> ConversionSummaryRespons
 
         # Extract basic information
         if result:
-            created_at = getattr(result, "created_at", datetime.utcnow())
+            created_at = getattr(result, "created_at", now)
             if not isinstance(created_at, datetime):
-                created_at = datetime.utcnow()
+                created_at = now
 
             completed_at = getattr(result, "completed_at", None)
             if not isinstance(completed_at, datetime) and completed_at is not None:
@@ -1061,14 +1553,7 @@ async def get_conversion_summary(conversion_id: str) -> ConversionSummaryRespons
             packages_used = []
 
         # Map orchestrator status to API status
-        status_mapping = {
-            ConversionStatusEnum.PENDING: ConversionStatus.PENDING,
-            ConversionStatusEnum.RUNNING: ConversionStatus.PROCESSING,
-            ConversionStatusEnum.COMPLETED: ConversionStatus.COMPLETED,
-            ConversionStatusEnum.FAILED: ConversionStatus.FAILED,
-            ConversionStatusEnum.CANCELLED: ConversionStatus.CANCELLED,
-        }
-        api_status = status_mapping.get(status, ConversionStatus.PENDING)
+        api_status = _STATUS_MAPPING.get(status, ConversionStatus.PENDING)
 
         # Create and return summary response
         return ConversionSummaryResponse(
@@ -1149,19 +1634,46 @@ async def download_conversion_result(conversion_id: str) -> FileResponse:
                 },
             )
 
-        # Create a ZIP file with the conversion results
-        output_zip = output_dir / f"{conversion_id}_result.zip"
-        _create_result_zip(output_dir, output_zip)
+        # Reuse the archive built by an earlier download of a finished job
+        cached_zip = conversion_data.get("result_zip")
+        if cached_zip and Path(cached_zip).exists():
+            output_zip = Path(cached_zip)
+        else:
+            # Outputs of a finished job no longer change, so its archive
+            # only has to be built once
+            job_finished = (
+                get_orchestrator().get_job_status(conversion_id) in _TERMINAL_STATUSES
+            )
+
+            # Create a ZIP file with the conversion results, unless one built
+            # earlier is still newer than every output file
+            output_zip = output_dir / f"{conversion_id}_result.zip"
+            # Build the archive in a worker thread so the event loop keeps serving
+            if not await asyncio.to_thread(
+                _is_result_zip_fresh, output_dir, output_zip
+            ):
+                await asyncio.to_thread(_replace_result_zip, output_dir, output_zip)
 
-        if not output_zip.exists():
+            if job_finished and output_zip.exists():
+                _safe_update_conversion(
+                    conversion_id, {"result_zip": str(output_zip)}
+                )
+
+        try:
+            zip_stat = os.stat(output_zip)
+        except FileNotFoundError:
             raise HTTPException(
                 status_code=500, detail="Failed to create download package"
-            )
+            ) from None
 
+        # Passing the stat result lets Starlette derive Content-Length, ETag
+        # and Last-Modified without another stat call. FileResponse serves
+        # Range requests itself, so interrupted downloads can be resumed.
         return FileResponse(
             path=str(output_zip),
             filename=f"conversion_{conversion_id}.zip",
             media_type="application/zip",
+            stat_result=zip_stat,
         )
     except HTTPException:
         raise
@@ -1173,12 +1685,99 @@ async def download_conversion_result(conversion_id: str) -> FileResponse:
 # Helper functions
 
 
+async def _save_upload_file(file: UploadFile, destination: Path, file_ext: str) -> int:
+    """
+    Stream an uploaded file to disk in fixed-size chunks.
+
+    Each chunk is size-checked and written straight to ``destination``, so
+    the upload is never buffered in memory in full. Uncompressed uploads are
+    also scanned for suspicious patterns in this single pass. The archive
+    signature is validated from the leading header bytes of the first chunk.
+
+    Args:
+        file: Uploaded file
+        destination: Path to write the upload to
+        file_ext: Lower-cased file extension
+
+    Returns:
+        int: Number of bytes written
+
+    Raises:
+        HTTPException: 413 if the upload exceeds MAX_FILE_SIZE,
+            400 if the content fails validation
+    """
+    total_size = 0
+    previous_tail = b""
+    scan_chunks = file_ext not in _COMPRESSED_ARCHIVE_EXTENSIONS
+
+    async with aiofiles.open(destination, "wb") as out_file:
+        while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+            if total_size == 0 and not _validate_file_content(
+                chunk[:_UPLOAD_HEADER_SIZE], file_ext
+            ):
+                raise HTTPException(status_code=400, detail=_INVALID_CONTENT_DETAIL)
+
+            total_size += len(chunk)
+            if total_size > settings.MAX_FILE_SIZE:
+                raise HTTPException(
+                    status_code=413,
+                    detail=(
+                        f"File too large. Maximum size: {settings.MAX_FILE_SIZE} bytes"
+                    ),
+                )
+
+            if scan_chunks:
+                match, previous_tail = _scan_chunk_for_suspicious_content(
+                    chunk, previous_tail
+                )
+                if match:
+                    logger.warning(
+                        f"Suspicious pattern found in uploaded file: {match.group()!r}"
+                    )
+                    raise HTTPException(
+                        status_code=400, detail=_INVALID_CONTENT_DETAIL
+                    )
+
+            await out_file.write(chunk)
+
+    if total_size == 0:
+        raise HTTPException(status_code=400, detail=_INVALID_CONTENT_DETAIL)
+
+    return total_size
+
+
+def _scan_chunk_for_suspicious_content(
+    chunk: bytes, previous_tail: bytes
+) -> tuple[re.Match[bytes] | None, bytes]:
+    """
+    Scan the next chunk of a byte stream for suspicious patterns.
+
+    The chunk is scanned on its own and together with the tail carried over
+    from the previous chunk, so a pattern straddling the boundary is found.
+
+    Args:
+        chunk: Next chunk of the stream
+        previous_tail: Tail returned for the previous chunk (b"" at the start)
+
+    Returns:
+        tuple: (first match or None, tail to pass along with the next chunk)
+    """
+    match = _SUSPICIOUS_CONTENT_RE.search(
+        previous_tail + chunk[:_SUSPICIOUS_OVERLAP]
+    ) or _SUSPICIOUS_CONTENT_RE.search(chunk)
+    tail = (previous_tail + chunk[-_SUSPICIOUS_OVERLAP:])[-_SUSPICIOUS_OVERLAP:]
+    return match, tail
+
+
 def _validate_file_content(file_content: bytes, file_ext: str) -> bool:
     """
     Validate file content for security and format.
 
+    Only the leading header bytes of an upload are passed in; the archive
+    signature checks need no more than that.
+
     Args:
-        file_content: File content as bytes
+        file_content: Leading bytes of the file
         file_ext: File extension
 
     Returns:
@@ -1188,21 +1787,14 @@ def _validate_file_content(file_content: bytes, file_ext: str) -> bool:
     if len(file_content) == 0:
         return False
 
-    # Check for suspicious patterns
-    suspicious_patterns = [
-        b"<script",
-        b"javascript:",
-        b"vbscript:",
-        b"data:text/html",
-        b"<iframe",
-        b"<object",
-        b"<embed",
-    ]
-
-    content_lower = file_content.lower()
-    for pattern in suspicious_patterns:
-        if pattern in content_lower:
-            logger.warning(f"Suspicious pattern found in uploaded file: {pattern!r}")
+    # Check for suspicious patterns (compressed archives are checked
+    # member by member after extraction)
+    if file_ext not in _COMPRESSED_ARCHIVE_EXTENSIONS:
+        match = _SUSPICIOUS_CONTENT_RE.search(file_content)
+        if match:
+            logger.warning(
+                f"Suspicious pattern found in uploaded file: {match.group()!r}"
+            )
             return False
 
     # File-specific validation
@@ -1230,9 +1822,10 @@ def _parse_conversion_options(options: str | None) -> dict[str, Any] | None:
         return None
 
     try:
-        options_dict = json.loads(options)
+        # pydantic-core's native JSON parser is faster than the stdlib json module
+        options_dict = from_json(options)
         return options_dict
-    except (json.JSONDecodeError, ValueError) as exc:
+    except ValueError as exc:
         logger.warning(f"Invalid conversion options: {exc}")
         return None
 
@@ -1252,39 +1845,121 @@ def _extract_archive(input_file: Path, temp_dir: Path, timeout: int = 300) -> Pa
     Raises:
         HTTPException: If extraction fails, times out, or archive is malicious
     """
-    import tarfile
-    import zipfile
-    from concurrent.futures import ThreadPoolExecutor
-    from concurrent.futures import TimeoutError as FuturesTimeoutError
-
     extracted_dir = temp_dir / "extracted"
     extracted_dir.mkdir(exist_ok=True)
 
-    def is_safe_path(base_path: Path, target_path: Path) -> bool:
-        """Check if target_path is within base_path (prevents zip slip)."""
+    # Extraction checks this deadline between members, so a slow archive
+    # stops itself instead of running on unattended after the timeout
+    deadline = time.monotonic() + timeout
+
+    def check_deadline() -> None:
+        """Abort extraction once the timeout has passed."""
+        if time.monotonic() > deadline:
+            raise HTTPException(
+                status_code=408,
+                detail=(
+                    f"Archive extraction timed out after {timeout} seconds. "
+                    f"File may be too large or corrupted."
+                ),
+            )
+
+    # The extraction root is the same for every member, so normalise it once
+    base_abs = os.path.abspath(extracted_dir)
+    base_prefix = base_abs + os.sep
+
+    def is_safe_path(target_path: Path) -> bool:
+        """Check if target_path is within extracted_dir (prevents zip slip)."""
+        # Normalise lexically; unlike resolve() this needs no filesystem
+        # calls. Tar members are written as they are validated, so earlier
+        # members may already be on disk when a later one is checked. That
+        # stays safe because every member gets this lexical check, link
+        # members are rejected outright (no path can run through an archive
+        # symlink), and tar extraction also applies filter="data". Comparing
+        # against the base plus a separator keeps a sibling such as
+        # "extracted_evil" from being mistaken for "extracted".
+        target_abs = os.path.abspath(target_path)
+        return target_abs == base_abs or target_abs.startswith(base_prefix)
+
+    # Set when a ZIP extraction worker fails, so the others stop early
+    # instead of extracting members that are about to be discarded
+    stop_extraction = threading.Event()
+
+    def extract_zip_member(
+        zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo, target_path: Path
+    ) -> None:
+        """Stream a single ZIP member to disk in fixed-size chunks."""
+        if member.is_dir():
+            target_path.mkdir(parents=True, exist_ok=True)
+            return
+
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        with zip_ref.open(member) as source, open(target_path, "wb") as target:
+            while chunk := source.read(_EXTRACT_CHUNK_SIZE):
+                if stop_extraction.is_set():
+                    return
+                target.write(chunk)
+
+    def extract_zip_members(members: list[zipfile.ZipInfo]) -> None:
+        """Extract a share of the ZIP members through a private ZipFile handle."""
+        # Reads through one ZipFile are serialised on its shared file handle,
+        # so each worker opens the archive itself
         try:
-            # Resolve to absolute paths
-            base_abs = base_path.resolve()
-            target_abs = target_path.resolve()
+            with zipfile.ZipFile(input_file, "r") as zip_ref:
+                for info in members:
+                    if stop_extraction.is_set():
+                        return
+                    check_deadline()
+                    extract_zip_member(zip_ref, info, extracted_dir / info.filename)
+        except BaseException:
+            stop_extraction.set()
+            raise
+
+    def reject_link(member_name: str) -> None:
+        """Refuse symlink and hard-link members outright."""
+        # A LaTeX project has no use for links, and refusing them up front
+        # means extraction never has to reason about where one points
+        raise HTTPException(
+            status_code=400,
+            detail=f"Archive contains a link, which is not allowed: {member_name}",
+        )
 
-            # Check if target is within base
-            return str(target_abs).startswith(str(base_abs))
-        except Exception:
-            return False
+    def check_extracted_size(total_size: int) -> None:
+        """Reject archives that would expand beyond MAX_EXTRACTED_SIZE."""
+        if total_size > settings.MAX_EXTRACTED_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"Archive too large when extracted. Maximum size: "
+                    f"{settings.MAX_EXTRACTED_SIZE} bytes"
+                ),
+            )
 
     def perform_extraction() -> Path:
-        """Perform the actual extraction (called with timeout)."""
-        from app.config import settings
-        from app.utils.path_utils import validate_path_depth
-        
-        if input_file.suffix.lower() == ".zip":
+        """Perform the actual extraction."""
+        # Lower-case the name once; ".gz" also covers ".tar.gz"
+        archive_name = input_file.name.lower()
+        if archive_name.endswith(".zip"):
             with zipfile.ZipFile(input_file, "r") as zip_ref:
-                # Validate all paths before extraction
-                for member in zip_ref.namelist():
+                members = zip_ref.infolist()
+
+                # Validate all paths and the total uncompressed size before
+                # anything is written. ZipExtFile never yields more than a
+                # member's declared file_size, so the declared sizes bound
+                # what extraction can write.
+                total_size = 0
+                for info in members:
+                    member = info.filename
                     member_path = extracted_dir / member
-                    
+
+                    total_size += info.file_size
+                    check_extracted_size(total_size)
+
+                    # Unix mode bits live in the high half of external_attr
+                    if stat.S_ISLNK(info.external_attr >> 16):
+                        reject_link(member)
+
                     # Security: Check for zip slip
-                    if not is_safe_path(extracted_dir, member_path):
+                    if not is_safe_path(member_path):
                         raise HTTPException(
                             status_code=400,
                             detail=(
@@ -1308,135 +1983,220 @@ def _extract_archive(input_file: Path, temp_dir: Path, timeout: int = 300) -> Pa
                             # Continue extraction but log warning
                             # (Some archives may have deep but valid paths)
 
-                # Extract all files preserving full directory structure
-                # This handles arbitrarily deep directory trees
-                zip_ref.extractall(extracted_dir)
-
-        elif input_file.suffix.lower() in [".tar", ".gz"] or input_file.name.endswith(
-            ".tar.gz"
-        ):
-            with tarfile.open(input_file, "r:*") as tar_ref:
-                # Validate all paths before extraction
-                for member in tar_ref.getmembers():
-                    member_path = extracted_dir / member.name
-                    if not is_safe_path(extracted_dir, member_path):
-                        raise HTTPException(
-                            status_code=400,
-                            detail=(
-                                f"Archive contains unsafe path: {member.name} "
-                                f"(potential zip slip attack)"
-                            ),
+                # A repeated name keeps only its last entry, as sequential
+                # extraction would, so the result never depends on which
+                # worker thread happens to write last
+                members = list({info.filename: info for info in members}.values())
+
+                # Extract member by member, streaming each one to disk so a
+                # large member never has to be held in memory in full.
+                # Full directory structure is preserved.
+                workers = min(_EXTRACT_MAX_WORKERS, len(members))
+                if workers <= 1:
+                    for info in members:
+                        check_deadline()
+                        extract_zip_member(
+                            zip_ref, info, extracted_dir / info.filename
                         )
 
-                    # Additional security: check for absolute paths
-                    if member.name.startswith("/") or member.name.startswith(".."):
-                        raise HTTPException(
-                            status_code=400,
-                            detail=(
-                                f"Archive contains absolute or parent path: "
-                                f"{member.name}"
-                            ),
+            if workers > 1:
+                # Many small members are bound by file creation rather than
+                # CPU, and zlib releases the GIL, so spread them over threads
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(
+                        executor.map(
+                            extract_zip_members,
+                            [members[i::workers] for i in range(workers)],
                         )
+                    )
+
+        elif archive_name.endswith((".tar", ".gz")):
+            with (
+                open(input_file, "rb", buffering=_TAR_READ_BUFFER_SIZE) as archive_file,
+                tarfile.open(fileobj=archive_file, mode="r:*") as tar_ref,
+            ):
+
+                def validated_members():
+                    """Yield each member once its path and size pass the checks."""
+                    total_size = 0
+                    for member in tar_ref:
+                        check_deadline()
+                        member_path = extracted_dir / member.name
+
+                        total_size += member.size
+                        check_extracted_size(total_size)
+
+                        if member.issym() or member.islnk():
+                            reject_link(member.name)
+
+                        if not is_safe_path(member_path):
+                            raise HTTPException(
+                                status_code=400,
+                                detail=(
+                                    f"Archive contains unsafe path: {member.name} "
+                                    f"(potential zip slip attack)"
+                                ),
+                            )
+
+                        # Additional security: check for absolute paths
+                        if member.name.startswith("/") or member.name.startswith(
+                            ".."
+                        ):
+                            raise HTTPException(
+                                status_code=400,
+                                detail=(
+                                    f"Archive contains absolute or parent path: "
+                                    f"{member.name}"
+                                ),
+                            )
 
-                # Extract all files preserving full directory structure
-                # This handles arbitrarily deep directory trees
-                tar_ref.extractall(extracted_dir)
+                        yield member
+
+                # Validate and extract in a single pass over the archive
+                # instead of reading every header twice. A rejected member
+                # aborts extraction part-way, and whatever was already
+                # written is removed below. Full directory structure is preserved,
+                # and where available the "data" filter also refuses links
+                # outside the archive, device files and unsafe permissions.
+                if hasattr(tarfile, "data_filter"):
+                    tar_ref.extractall(
+                        extracted_dir, members=validated_members(), filter="data"
+                    )
+                else:
+                    tar_ref.extractall(extracted_dir, members=validated_members())
         else:
             raise ValueError(f"Unsupported archive format: {input_file.suffix}")
 
         return extracted_dir
 
     try:
-        # Use ThreadPoolExecutor for cross-platform timeout support
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(perform_extraction)
-            try:
-                extracted_dir = future.result(timeout=timeout)
-            except FuturesTimeoutError:
-                raise HTTPException(
-                    status_code=408,
-                    detail=(
-                        f"Archive extraction timed out after {timeout} seconds. "
-                        f"File may be too large or corrupted."
-                    ),
-                ) from None
+        extracted_dir = perform_extraction()
 
-        logger.info(f"Successfully extracted archive to: {extracted_dir}")
+        logger.info("Successfully extracted archive to: {}", extracted_dir)
         return extracted_dir
 
-    except TimeoutError as exc:
-        logger.error(f"Archive extraction timed out: {exc}")
-        raise HTTPException(
-            status_code=408,  # Request Timeout
-            detail=str(exc),
-        ) from exc
-    except HTTPException:
-        # Re-raise HTTP exceptions as-is
-        raise
     except Exception as exc:
+        # Members written before the failure are already on disk
+        shutil.rmtree(extracted_dir, ignore_errors=True)
+        if isinstance(exc, HTTPException):
+            # Re-raise HTTP exceptions (including the 408 timeout) as-is
+            raise
         logger.error(f"Failed to extract archive {input_file}: {exc}")
         raise HTTPException(
             status_code=400, detail=f"Failed to extract archive: {exc}"
         ) from exc
 
 
-def _find_main_tex_file(extracted_dir: Path) -> Path | None:
+def _scan_extracted_dir(extracted_dir: Path) -> tuple[Path | None, int, int]:
     """
-    Find the main LaTeX file in the extracted directory using breadth-first search.
-    
-    This handles deep directory structures without recursion limits.
+    Walk the extracted directory once, breadth-first, collecting everything
+    the upload handler needs before starting a conversion.
+
+    The main LaTeX file is chosen by preferring root-level candidate names,
+    then the first nested file with a candidate name, then the first .tex
+    file found; files under hidden or tool metadata directories are never
+    chosen. Those directories are still walked, since every file counts
+    towards the size and every text source is scanned for suspicious
+    patterns. Directory symlinks are not followed.
 
     Args:
         extracted_dir: Path to extracted directory
 
     Returns:
-        Path: Path to main LaTeX file or None if not found
+        tuple: (main LaTeX file or None, total size in bytes, file count)
+
+    Raises:
+        HTTPException: 400 if a text source contains a suspicious pattern
     """
-    from app.config import settings
-    from app.utils.path_utils import find_files_bfs
-
-    # Look for common LaTeX file names first (breadth-first)
-    main_candidates = [
-        "main.tex",
-        "document.tex",
-        "paper.tex",
-        "article.tex",
-        "thesis.tex",
-        "report.tex",
-        "manuscript.tex",
-        "finalmanuscript.tex",
-    ]
+    root_candidates: dict[str, Path] = {}
+    first_by_name: dict[str, Path] = {}
+    first_tex: Path | None = None
+    total_size = 0
+    file_count = 0
+
+    max_depth = settings.MAX_PATH_DEPTH
+    # (directory, depth, whether its .tex files may be the main file)
+    queue: deque[tuple[str, int, bool]] = deque([(str(extracted_dir), 0, True)])
+    while queue:
+        current_dir, depth, is_source_dir = queue.popleft()
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if max_depth is None or depth < max_depth:
+                            queue.append(
+                                (
+                                    entry.path,
+                                    depth + 1,
+                                    is_source_dir
+                                    and not entry.name.startswith(".")
+                                    and entry.name not in _NON_SOURCE_DIRS,
+                                )
+                            )
+                        continue
+                    if not entry.is_file():
+                        continue
 
-    # Check for main candidates in root first
-    for candidate in main_candidates:
-        candidate_path = extracted_dir / candidate
-        if candidate_path.exists() and candidate_path.is_file():
-            return candidate_path
+                    try:
+                        total_size += entry.stat().st_size
+                        file_count += 1
+                    except OSError:
+                        continue
+
+                    name = entry.name
+                    if depth == 0 and name in _MAIN_TEX_CANDIDATE_SET:
+                        root_candidates[name] = Path(entry.path)
+                    lower_name = name.lower()
+                    if lower_name.endswith(_SCANNED_SOURCE_SUFFIXES):
+                        _check_source_content(entry.path)
+                    if is_source_dir and lower_name.endswith(".tex"):
+                        if first_tex is None:
+                            first_tex = Path(entry.path)
+                        if lower_name in _MAIN_TEX_CANDIDATE_SET:
+                            first_by_name.setdefault(lower_name, Path(entry.path))
+        except OSError as exc:
+            logger.warning(f"Failed to scan {current_dir}: {exc}")
 
-    # Use breadth-first search to find .tex files
-    # This handles deep directory structures without recursion limits
-    try:
-        tex_files = find_files_bfs(
-            extracted_dir,
-            "*.tex",
-            max_depth=settings.MAX_PATH_DEPTH,
-            follow_symlinks=False,
+    main_tex: Path | None = first_tex
+    for candidates in (root_candidates, first_by_name):
+        match = next(
+            (candidates[name] for name in _MAIN_TEX_CANDIDATES if name in candidates),
+            None,
         )
-        
-        if tex_files:
-            # Prefer files with main candidate names
-            for candidate in main_candidates:
-                for tex_file in tex_files:
-                    if tex_file.name.lower() == candidate.lower():
-                        return tex_file
-            
-            # Return the first .tex file found (breadth-first order)
-            return tex_files[0]
-    except Exception as exc:
-        logger.warning(f"BFS search failed, falling back to glob: {exc}")
-        # Fallback to simple glob
-        tex_files = list(extracted_dir.glob("*.tex"))
-        if tex_files:
-            return tex_files[0]
+        if match is not None:
+            main_tex = match
+            break
+
+    return main_tex, total_size, file_count
+
+
+def _check_source_content(source_path: str) -> None:
+    """
+    Reject an extracted text source that contains a suspicious pattern.
 
-    return None
+    The file is read in chunks, like an upload, so a large source is never
+    held in memory in full.
+
+    Args:
+        source_path: Path to the extracted source file
+
+    Raises:
+        HTTPException: 400 if a suspicious pattern is found
+    """
+    match = None
+    previous_tail = b""
+    try:
+        with open(source_path, "rb") as source_file:
+            while match is None and (chunk := source_file.read(_UPLOAD_CHUNK_SIZE)):
+                match, previous_tail = _scan_chunk_for_suspicious_content(
+                    chunk, previous_tail
+                )
+    except OSError as exc:
+        logger.warning(f"Failed to read {source_path}: {exc}")
+        return
+
+    if match:
+        logger.warning(
+            f"Suspicious pattern found in {Path(source_path).name}: {match.group()!r}"
+        )
+        raise HTTPException(status_code=400, detail=_INVALID_CONTENT_DETAIL)
@@ -33,9 +33,11 @@ class Settings(BaseSettings):
 
     # Logging settings
     LOG_LEVEL: str = "INFO"
+    LOG_SERIALIZE: bool = False  # Write the production log file as JSON lines
 
     # File upload settings
     MAX_FILE_SIZE: int = 100 * 1024 * 1024  # 100MB
+    MAX_EXTRACTED_SIZE: int = 1024 * 1024 * 1024  # 1GB total after extraction
     ALLOWED_EXTENSIONS: list[str] = [".zip", ".tar.gz", ".tar"]
     UPLOAD_DIR: str = "uploads"
     OUTPUT_DIR: str = "outputs"
@@ -65,6 +67,8 @@ class Settings(BaseSettings):
     CONVERSION_TIMEOUT: int = 1800  # 30 minutes (base timeout, adaptive timeout may be higher)
     MAX_CONCURRENT_CONVERSIONS: int = 5
     CONVERSION_RETENTION_HOURS: int = 24  # How long to keep conversion results
+    # Oldest finished conversions are evicted, even inside retention, beyond this
+    MAX_TRACKED_CONVERSIONS: int = 10000
 
     # Path depth settings
     MAX_PATH_DEPTH: int | None = None  # Maximum path depth (None = unlimited)
@@ -98,6 +98,9 @@ async def lifespan(_app: FastAPI):
     # Stop cleanup thread
     conversion.stop_cleanup_thread()
 
+    # Flush messages still queued for the enqueued log handlers
+    await logger.complete()
+
 
 def create_app() -> FastAPI:
     """
@@ -183,6 +186,9 @@ def setup_routers(fastapi_app: FastAPI) -> None:
 def setup_logging() -> None:
     """
     Configure logging with loguru.
+
+    Handlers are enqueued so that formatting and writes happen on loguru's
+    background worker rather than on the request path.
     """
     logger.remove()  # Remove default handler
 
@@ -197,6 +203,7 @@ def setup_logging() -> None:
         ),
         level=settings.LOG_LEVEL,
         colorize=True,
+        enqueue=True,
     )
 
     # Add file handler for production
@@ -214,6 +221,8 @@ def setup_logging() -> None:
                 "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | "
                 "{name}:{function}:{line} - {message}"
             ),
+            serialize=settings.LOG_SERIALIZE,
+            enqueue=True,
         )
 
 
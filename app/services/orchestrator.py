@@ -7,6 +7,7 @@ resource management, and coordination between different services.
 
 import threading
 import time
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -91,6 +92,7 @@ class ConversionOrchestrator:
         output_dir: Path,
         options: ConversionOptions | None = None,
         job_id: str | None = None,
+        on_complete: Callable[[ConversionJob], None] | None = None,
     ) -> str:
         """
         Start a new conversion job.
@@ -100,6 +102,8 @@ class ConversionOrchestrator:
             output_dir: Path to output directory
             options: Conversion options
             job_id: Optional job ID
+            on_complete: Optional callback invoked with the job on the
+                conversion thread once the pipeline has finished
 
         Returns:
             str: Job ID
@@ -142,7 +146,7 @@ class ConversionOrchestrator:
                 self._stats["total_jobs"] += 1
 
                 # Start conversion in background
-                self._start_conversion_task(job)
+                self._start_conversion_task(job, on_complete)
 
                 logger.info(f"Started conversion job: {job.job_id}")
                 return job.job_id
@@ -294,6 +298,87 @@ class ConversionOrchestrator:
 
             return self._pipeline.create_conversion_result(job)
 
+    def get_job_statuses(self, job_ids: list[str]) -> dict[str, ConversionStatus]:
+        """
+        Get the status of many jobs in one pass.
+
+        Equivalent to calling get_job_status for each ID, but takes the job
+        lock once for the whole batch and builds nothing beyond the status.
+
+        Args:
+            job_ids: Job identifiers
+
+        Returns:
+            dict: Mapping of job ID to status; unknown jobs are omitted
+        """
+        statuses: dict[str, ConversionStatus] = {}
+        missing: list[str] = []
+
+        with self._job_lock:
+            for job_id in job_ids:
+                job = self._jobs.get(job_id)
+                if job:
+                    statuses[job_id] = job.status
+                else:
+                    missing.append(job_id)
+
+        for job_id in missing:
+            status = self._pipeline.get_job_status(job_id)
+            if status:
+                statuses[job_id] = status
+
+        return statuses
+
+    def get_jobs_bulk(
+        self, job_ids: list[str]
+    ) -> dict[
+        str,
+        tuple[ConversionStatus, ConversionProgress | None, ConversionResult | None],
+    ]:
+        """
+        Get status, progress and result for many jobs in one pass.
+
+        Equivalent to calling get_job_status, get_job_progress and
+        get_job_result for each ID, but takes the job lock once for the
+        whole batch instead of three times per job.
+
+        Args:
+            job_ids: Job identifiers
+
+        Returns:
+            dict: Mapping of job ID to (status, progress, result); unknown
+            jobs are omitted
+        """
+        jobs: dict[
+            str,
+            tuple[ConversionStatus, ConversionProgress | None, ConversionResult | None],
+        ] = {}
+        missing: list[str] = []
+
+        with self._job_lock:
+            for job_id in job_ids:
+                job = self._jobs.get(job_id)
+                if not job:
+                    missing.append(job_id)
+                    continue
+
+                result = None
+                if job.status in (ConversionStatus.COMPLETED, ConversionStatus.FAILED):
+                    result = self._pipeline.create_conversion_result(job)
+                jobs[job_id] = (
+                    job.status,
+                    self._calculate_progress_from_job(job),
+                    result,
+                )
+
+        # Jobs still owned by the pipeline have no result yet
+        for job_id in missing:
+            status = self._pipeline.get_job_status(job_id)
+            if status:
+                jobs[job_id] = (status, self._pipeline.get_job_progress(job_id), None)
+
+        return jobs
+
     def get_job_diagnostics(self, job_id: str) -> dict[str, Any] | None:
         """
         Get detailed diagnostics for a conversion job.
@@ -480,7 +565,11 @@ class ConversionOrchestrator:
 
         logger.info("Conversion orchestrator shutdown complete")
 
-    def _start_conversion_task(self, job: ConversionJob) -> None:
+    def _start_conversion_task(
+        self,
+        job: ConversionJob,
+        on_complete: Callable[[ConversionJob], None] | None = None,
+    ) -> None:
         """Start a conversion task in a background thread."""
 
         def _run_conversion():
@@ -507,6 +596,16 @@ class ConversionOrchestrator:
 
                 logger.info(f"Conversion task completed for job: {job.job_id}")
 
+                # Run post-processing outside the lock; a failing callback
+                # must not mark a finished conversion as failed
+                if on_complete:
+                    try:
+                        on_complete(job)
+                    except Exception as exc:
+                        logger.exception(
+                            f"Completion callback failed for job {job.job_id}: {exc}"
+                        )
+
             except Exception as exc:
                 # Catch all exceptions to ensure job cleanup and status update
                 logger.exception(f"Conversion task failed for job {job.job_id}: {exc}")
@@ -167,44 +167,57 @@ class ConversionPipeline:
                 # Cache the result
                 self._file_metadata_cache[cache_key] = (total_size, file_count, current_time)
             
-            # Adaptive timeout calculation for files up to 100MB:
-            # Base: 10 minutes (600s)
-            # + 30 seconds per MB for files up to 20MB
-            # + 60 seconds per MB for files 20-50MB  
-            # + 90 seconds per MB for files 50-100MB
-            # + 1 second per file (complexity factor)
-            # This ensures 100MB files get ~2.1 hours (7600s), with max of 4 hours
-            
-            size_mb = total_size / (1024 * 1024)
-            
-            if size_mb <= 20:
-                size_factor = size_mb * 30  # 30 seconds per MB
-            elif size_mb <= 50:
-                size_factor = 600 + (size_mb - 20) * 60  # 60 seconds per MB above 20MB
-            elif size_mb <= 100:
-                size_factor = 2400 + (size_mb - 50) * 90  # 90 seconds per MB above 50MB
-            else:
-                # For files > 100MB, use maximum timeout (4 hours)
-                size_factor = 6900  # ~2 hours base for 100MB+ files
-            
-            file_factor = file_count * 1.0  # 1 second per file
-            
-            calculated_timeout = int(base_timeout + size_factor + file_factor)
-            
-            # Cap at maximum timeout (4 hours for very large/complex files up to 100MB)
-            timeout = min(calculated_timeout, self.max_timeout)
-            
-            logger.debug(
-                f"Calculated adaptive timeout: {timeout}s "
-                f"(size: {size_mb:.1f}MB, files: {file_count})"
-            )
-            
-            return timeout
+            return self._timeout_for_metrics(total_size, file_count)
             
         except Exception as exc:
             logger.warning(f"Failed to calculate adaptive timeout: {exc}, using default")
             return base_timeout
 
+    def _timeout_for_metrics(self, total_size: int, file_count: int) -> int:
+        """
+        Calculate adaptive timeout from already collected size metrics.
+        
+        Args:
+            total_size: Total size of the input in bytes
+            file_count: Number of files in the input
+            
+        Returns:
+            Timeout in seconds
+        """
+        # Adaptive timeout calculation for files up to 100MB:
+        # Base: 10 minutes (600s)
+        # + 30 seconds per MB for files up to 20MB
+        # + 60 seconds per MB for files 20-50MB  
+        # + 90 seconds per MB for files 50-100MB
+        # + 1 second per file (complexity factor)
+        # This ensures 100MB files get ~2.1 hours (7600s), with max of 4 hours
+        
+        size_mb = total_size / (1024 * 1024)
+        
+        if size_mb <= 20:
+            size_factor = size_mb * 30  # 30 seconds per MB
+        elif size_mb <= 50:
+            size_factor = 600 + (size_mb - 20) * 60  # 60 seconds per MB above 20MB
+        elif size_mb <= 100:
+            size_factor = 2400 + (size_mb - 50) * 90  # 90 seconds per MB above 50MB
+        else:
+            # For files > 100MB, use maximum timeout (4 hours)
+            size_factor = 6900  # ~2 hours base for 100MB+ files
+        
+        file_factor = file_count * 1.0  # 1 second per file
+        
+        calculated_timeout = int(self.default_timeout + size_factor + file_factor)
+        
+        # Cap at maximum timeout (4 hours for very large/complex files up to 100MB)
+        timeout = min(calculated_timeout, self.max_timeout)
+        
+        logger.debug(
+            f"Calculated adaptive timeout: {timeout}s "
+            f"(size: {size_mb:.1f}MB, files: {file_count})"
+        )
+        
+        return timeout
+
     def create_conversion_job(
         self,
         input_file: Path,
@@ -7,6 +7,7 @@ path validation, and security considerations.
 
 import os
 import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 
@@ -142,6 +143,42 @@ def cleanup_directory(path: str | Path, keep_files: set[str] | None = None) -> N
         raise
 
 
+def remove_directories(*paths: str | Path) -> None:
+    """
+    Remove directory trees, ignoring paths that no longer exist.
+
+    On POSIX all trees are removed by a single ``rm -rf`` invocation, which
+    avoids a Python-level call per entry on large extracted projects.
+    Anything left behind (or any platform without ``rm``) falls back to
+    ``shutil.rmtree``.
+
+    Args:
+        *paths: Directories to remove
+    """
+    existing = [str(path) for path in paths if os.path.lexists(path)]
+    if not existing:
+        return
+
+    rm_path = shutil.which("rm") if os.name == "posix" else None
+    if rm_path:
+        try:
+            result = subprocess.run(
+                [rm_path, "-rf", "--", *existing],
+                capture_output=True,
+                check=False,
+            )
+            if result.returncode == 0:
+                return
+            logger.debug(
+                f"rm -rf exited with {result.returncode}, falling back to rmtree"
+            )
+        except (OSError, subprocess.SubprocessError) as exc:
+            logger.debug(f"rm -rf failed ({exc}), falling back to rmtree")
+
+    for path in existing:
+        shutil.rmtree(path, ignore_errors=True)
+
+
 def safe_copy_file(src: str | Path, dst: str | Path, overwrite: bool = False) -> Path:
     """
     Safely copy a file with validation.
@@ -0,0 +1,727 @@
+"""
+Test the conversion API helper functions.
+"""
+
+import io
+import os
+import tarfile
+import threading
+import zipfile
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.api import conversion
+from app.config import settings
+from app.models.conversion import ConversionStatus as ConversionStatusEnum
+
+
+def _upload(content: bytes, filename: str = "project.zip") -> UploadFile:
+    """Build an in-memory UploadFile for the given content."""
+    return UploadFile(io.BytesIO(content), filename=filename)
+
+
+def _add_tar_member(tar: tarfile.TarFile, name: str, content: bytes) -> None:
+    """Add an in-memory file to a tar archive."""
+    info = tarfile.TarInfo(name)
+    info.size = len(content)
+    tar.addfile(info, io.BytesIO(content))
+
+
+class TestSaveUploadFile:
+    """Test streaming of uploads to disk."""
+
+    @pytest.mark.asyncio
+    async def test_streams_upload_to_disk(self, tmp_path):
+        """Test that the upload is written to disk unchanged."""
+        content = b"PK\x03\x04" + b"x" * (3 * conversion._UPLOAD_CHUNK_SIZE)
+        destination = tmp_path / "project.zip"
+
+        written = await conversion._save_upload_file(
+            _upload(content), destination, ".zip"
+        )
+
+        assert written == len(content)
+        assert destination.read_bytes() == content
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_upload(self, tmp_path, monkeypatch):
+        """Test that uploads over MAX_FILE_SIZE are rejected with 413."""
+        monkeypatch.setattr(settings, "MAX_FILE_SIZE", 16)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await conversion._save_upload_file(
+                _upload(b"PK" + b"x" * 32), tmp_path / "project.zip", ".zip"
+            )
+
+        assert exc_info.value.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_upload(self, tmp_path):
+        """Test that empty uploads are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            await conversion._save_upload_file(
+                _upload(b""), tmp_path / "project.zip", ".zip"
+            )
+
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_signature(self, tmp_path):
+        """Test that a .zip upload without the PK signature is rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            await conversion._save_upload_file(
+                _upload(b"not a zip archive"), tmp_path / "project.zip", ".zip"
+            )
+
+        assert exc_info.value.status_code == 400
+
+
+class TestConversionStorage:
+    """Test the sharded conversion storage helpers."""
+
+    def test_set_get_update_remove(self):
+        """Test the full lifecycle of a storage entry."""
+        conversion._safe_set_conversion("job-1", {"output_dir": "/tmp/out"})
+
+        assert conversion._safe_get_conversion("job-1") == {"output_dir": "/tmp/out"}
+        assert conversion._safe_update_conversion("job-1", {"zip_name": "paper"})
+        assert conversion._safe_get_conversion("job-1")["zip_name"] == "paper"
+        assert "job-1" in conversion._safe_list_conversion_ids()
+
+        removed = conversion._safe_remove_conversion("job-1")
+
+        assert removed == {"output_dir": "/tmp/out", "zip_name": "paper"}
+        assert conversion._safe_get_conversion("job-1") is None
+
+    def test_update_missing_conversion(self):
+        """Test that updating an unknown conversion reports failure."""
+        assert not conversion._safe_update_conversion("missing-job", {"a": 1})
+
+    def test_list_ids_spans_all_shards(self):
+        """Test that the ID snapshot covers every shard."""
+        ids = [f"job-{index}" for index in range(64)]
+        for conversion_id in ids:
+            conversion._safe_set_conversion(conversion_id, {})
+
+        try:
+            assert set(ids) <= set(conversion._safe_list_conversion_ids())
+        finally:
+            for conversion_id in ids:
+                conversion._safe_remove_conversion(conversion_id)
+
+    def test_requests_eviction_only_when_over_limit(self, monkeypatch):
+        """Test that going over the limit asks the cleanup thread to evict."""
+        monkeypatch.setattr(
+            conversion, "_conversion_store", conversion._ShardedConversionStore(1, 2)
+        )
+        monkeypatch.setattr(conversion, "_eviction_requested", threading.Event())
+        monkeypatch.setattr(conversion, "_expiry_heap", [])
+
+        now = conversion.time.time()
+        conversion._safe_set_conversion("job-old", {"created_at_ts": 946684800.0})
+        conversion._safe_set_conversion("job-recent", {"created_at_ts": now})
+        assert not conversion._eviction_requested.is_set()
+
+        conversion._safe_set_conversion("job-new", {"created_at_ts": now})
+
+        assert conversion._eviction_requested.is_set()
+        # Nothing is removed until the cleanup thread has checked the jobs
+        assert sorted(conversion._safe_list_conversion_ids()) == [
+            "job-new",
+            "job-old",
+            "job-recent",
+        ]
+
+    @pytest.mark.parametrize("shard_count", [0, 3, 12])
+    def test_rejects_non_power_of_two_shard_count(self, shard_count):
+        """Test that the shard count must allow bit-mask indexing."""
+        with pytest.raises(ValueError):
+            conversion._ShardedConversionStore(shard_count)
+
+
+class TestConversionExpiry:
+    """Test event-driven cleanup of expired conversions."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_expiry(self, monkeypatch):
+        """Give each test its own expiry heap and a stub orchestrator."""
+        self.statuses = {}
+        orchestrator = SimpleNamespace(
+            get_job_statuses=lambda ids: {
+                cid: self.statuses[cid] for cid in ids if cid in self.statuses
+            }
+        )
+        monkeypatch.setattr(conversion, "_expiry_heap", [])
+        monkeypatch.setattr(conversion, "_eviction_requested", threading.Event())
+        monkeypatch.setattr(conversion, "get_orchestrator", lambda: orchestrator)
+
+    def test_due_entries_are_returned_in_expiry_order(self):
+        """Test that only entries whose expiry has passed are handed out."""
+        now = conversion.time.time()
+        conversion._schedule_conversion_expiry("job-late", now - 1)
+        conversion._schedule_conversion_expiry("job-early", now - 10)
+        conversion._schedule_conversion_expiry("job-future", now + 3600)
+
+        assert conversion._wait_for_due_conversions() == ["job-early", "job-late"]
+        assert [cid for _, cid in conversion._expiry_heap] == ["job-future"]
+
+    def test_removes_finished_entry_and_directories(self, tmp_path):
+        """Test that an expired finished job is removed with its files."""
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        conversion._safe_set_conversion(
+            "job-done",
+            {"output_dir": str(output_dir), "created_at_ts": 946684800.0},
+        )
+        self.statuses["job-done"] = ConversionStatusEnum.COMPLETED
+
+        assert conversion._cleanup_old_conversions(["job-done"]) == 1
+        assert conversion._safe_get_conversion("job-done") is None
+        assert not output_dir.exists()
+
+    def test_eviction_keeps_running_job_directory(self, tmp_path, monkeypatch):
+        """Test that evicting from a full store spares a running job."""
+        monkeypatch.setattr(
+            conversion, "_conversion_store", conversion._ShardedConversionStore(1, 1)
+        )
+        upload_dir = tmp_path / "upload"
+        upload_dir.mkdir()
+        conversion._safe_set_conversion(
+            "job-running",
+            {"upload_dir": str(upload_dir), "created_at_ts": 946684800.0},
+        )
+        self.statuses["job-running"] = ConversionStatusEnum.RUNNING
+        self.statuses["job-new"] = ConversionStatusEnum.RUNNING
+
+        conversion._safe_set_conversion(
+            "job-new", {"created_at_ts": conversion.time.time()}
+        )
+        assert conversion._eviction_requested.is_set()
+
+        assert conversion._cleanup_old_conversions([]) == 0
+        assert upload_dir.is_dir()
+        assert conversion._safe_get_conversion("job-running") is not None
+
+    def test_eviction_removes_oldest_finished_jobs(self, tmp_path, monkeypatch):
+        """Test that a full store evicts finished jobs, oldest first."""
+        monkeypatch.setattr(
+            conversion, "_conversion_store", conversion._ShardedConversionStore(1, 2)
+        )
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        now = conversion.time.time()
+        conversion._safe_set_conversion("job-running", {"created_at_ts": now - 30})
+        conversion._safe_set_conversion(
+            "job-done-old",
+            {"output_dir": str(output_dir), "created_at_ts": now - 20},
+        )
+        conversion._safe_set_conversion("job-done-new", {"created_at_ts": now - 10})
+        # Not known to the orchestrator yet, as while a job is being started
+        conversion._safe_set_conversion("job-starting", {"created_at_ts": now})
+        self.statuses["job-running"] = ConversionStatusEnum.RUNNING
+        self.statuses["job-done-old"] = ConversionStatusEnum.COMPLETED
+        self.statuses["job-done-new"] = ConversionStatusEnum.FAILED
+
+        assert conversion._cleanup_old_conversions([]) == 2
+        assert not output_dir.exists()
+        assert sorted(conversion._safe_list_conversion_ids()) == [
+            "job-running",
+            "job-starting",
+        ]
+        assert not conversion._eviction_requested.is_set()
+
+    def test_reschedules_running_entry(self):
+        """Test that a job still running at expiry is checked again later."""
+        conversion._safe_set_conversion(
+            "job-running", {"created_at_ts": 946684800.0}
+        )
+        self.statuses["job-running"] = ConversionStatusEnum.RUNNING
+        conversion._expiry_heap.clear()
+
+        try:
+            assert conversion._cleanup_old_conversions(["job-running"]) == 0
+            assert conversion._safe_get_conversion("job-running") is not None
+            assert [cid for _, cid in conversion._expiry_heap] == ["job-running"]
+        finally:
+            conversion._safe_remove_conversion("job-running")
+
+
+class TestValidateFileContent:
+    """Test validation of uploaded file headers."""
+
+    def test_accepts_zip_signature(self):
+        """Test that a ZIP header passes validation."""
+        assert conversion._validate_file_content(b"PK\x03\x04rest", ".zip")
+
+    @pytest.mark.parametrize(
+        "content",
+        [b"<script>", b"<SCRIPT>", b" JavaScript:alert(1)", b"<IFrame"],
+    )
+    def test_rejects_suspicious_patterns_case_insensitively(self, content):
+        """Test that suspicious markup is caught regardless of case."""
+        assert not conversion._validate_file_content(content + b"\0" * 512, ".tar")
+
+    def test_does_not_scan_compressed_archive_bytes(self):
+        """Test that ZIP headers are only checked for their signature."""
+        assert conversion._validate_file_content(b"PK<script>", ".zip")
+
+
+class TestFindMainTexFile:
+    """Test discovery of the main LaTeX file."""
+
+    def test_prefers_root_candidate_by_priority(self, tmp_path):
+        """Test that root candidates are chosen in priority order."""
+        (tmp_path / "paper.tex").write_text("\\documentclass{article}")
+        (tmp_path / "main.tex").write_text("\\documentclass{article}")
+        (tmp_path / "notes.tex").write_text("notes")
+
+        assert conversion._scan_extracted_dir(tmp_path)[0] == tmp_path / "main.tex"
+
+    def test_finds_candidate_in_subdirectory(self, tmp_path):
+        """Test that a nested candidate beats other nested .tex files."""
+        nested = tmp_path / "project" / "src"
+        nested.mkdir(parents=True)
+        (tmp_path / "project" / "appendix.tex").write_text("appendix")
+        (nested / "Main.tex").write_text("\\documentclass{article}")
+
+        assert conversion._scan_extracted_dir(tmp_path)[0] == nested / "Main.tex"
+
+    def test_ignores_metadata_directories(self, tmp_path):
+        """Test that .tex files under hidden or archiver dirs are not chosen."""
+        (tmp_path / "__MACOSX").mkdir()
+        (tmp_path / "__MACOSX" / "main.tex").write_bytes(b"\0\5\26\7")
+        (tmp_path / ".history").mkdir()
+        (tmp_path / ".history" / "old.tex").write_text("old")
+        (tmp_path / "paper").mkdir()
+        (tmp_path / "paper" / "paper.tex").write_text("\\documentclass{article}")
+
+        assert conversion._scan_extracted_dir(tmp_path)[0] == (
+            tmp_path / "paper" / "paper.tex"
+        )
+
+    def test_returns_none_without_tex_files(self, tmp_path):
+        """Test that None is returned when no .tex file exists."""
+        (tmp_path / "figure.png").write_bytes(b"\x89PNG")
+
+        assert conversion._scan_extracted_dir(tmp_path)[0] is None
+
+    @pytest.mark.parametrize("max_depth", [None, 0])
+    def test_scan_respects_max_path_depth(self, tmp_path, monkeypatch, max_depth):
+        """Test that MAX_PATH_DEPTH limits the walk and may be unset."""
+        monkeypatch.setattr(settings, "MAX_PATH_DEPTH", max_depth)
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "thesis.tex").write_text("\\documentclass{book}")
+
+        main_tex = conversion._scan_extracted_dir(tmp_path)[0]
+
+        expected = tmp_path / "src" / "thesis.tex" if max_depth is None else None
+        assert main_tex == expected
+
+    def test_scan_reports_size_and_file_count(self, tmp_path):
+        """Test that the same walk measures the whole project."""
+        (tmp_path / "figures").mkdir()
+        (tmp_path / "main.tex").write_bytes(b"a" * 10)
+        (tmp_path / "figures" / "plot.png").write_bytes(b"b" * 5)
+
+        main_tex, total_size, file_count = conversion._scan_extracted_dir(tmp_path)
+
+        assert main_tex == tmp_path / "main.tex"
+        assert total_size == 15
+        assert file_count == 2
+
+
+class TestExtractArchive:
+    """Test archive extraction."""
+
+    def test_extracts_nested_zip_members(self, tmp_path):
+        """Test that ZIP members are extracted with their directory layout."""
+        archive = tmp_path / "project.zip"
+        with zipfile.ZipFile(archive, "w") as zipf:
+            zipf.writestr("main.tex", "\\documentclass{article}")
+            zipf.writestr("figures/plot.svg", "<svg/>")
+            zipf.writestr("empty/", "")
+
+        extracted_dir = conversion._extract_archive(archive, tmp_path)
+
+        assert (extracted_dir / "main.tex").read_text() == "\\documentclass{article}"
+        assert (extracted_dir / "figures" / "plot.svg").read_text() == "<svg/>"
+        assert (extracted_dir / "empty").is_dir()
+
+    @pytest.mark.parametrize(
+        "member",
+        ["../evil.tex", "../extracted_evil/x.tex", "nested/../../evil.tex"],
+    )
+    def test_rejects_zip_slip(self, tmp_path, member):
+        """Test that members escaping the extraction directory are rejected."""
+        archive = tmp_path / "project.zip"
+        with zipfile.ZipFile(archive, "w") as zipf:
+            zipf.writestr(member, "payload")
+
+        with pytest.raises(HTTPException) as exc_info:
+            conversion._extract_archive(archive, tmp_path)
+
+        assert exc_info.value.status_code == 400
+        assert not (tmp_path / "evil.tex").exists()
+
+    @pytest.mark.filterwarnings("ignore:Duplicate name")
+    def test_duplicate_zip_members_keep_last_entry(self, tmp_path, monkeypatch):
+        """Test that parallel extraction writes the last of repeated names."""
+        monkeypatch.setattr(conversion, "_EXTRACT_MAX_WORKERS", 4)
+        archive = tmp_path / "project.zip"
+        with zipfile.ZipFile(archive, "w") as zipf:
+            zipf.writestr("main.tex", "first")
+            for index in range(8):
+                zipf.writestr(f"sections/s{index}.tex", "section")
+            zipf.writestr("main.tex", "last")
+
+        extracted_dir = conversion._extract_archive(archive, tmp_path)
+
+        assert (extracted_dir / "main.tex").read_text() == "last"
+        assert len(list((extracted_dir / "sections").iterdir())) == 8
+
+    def test_extracts_nested_tar_members(self, tmp_path):
+        """Test that tar.gz members are extracted with their directory layout."""
+        archive = tmp_path / "project.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            _add_tar_member(tar, "main.tex", b"\\documentclass{article}")
+            _add_tar_member(tar, "figures/plot.svg", b"<svg/>")
+
+        extracted_dir = conversion._extract_archive(archive, tmp_path)
+
+        assert (extracted_dir / "main.tex").read_bytes() == b"\\documentclass{article}"
+        assert (extracted_dir / "figures" / "plot.svg").read_bytes() == b"<svg/>"
+
+    def test_rejects_tar_slip(self, tmp_path):
+        """Test that tar members escaping the extraction directory are rejected."""
+        archive = tmp_path / "project.tar"
+        with tarfile.open(archive, "w") as tar:
+            _add_tar_member(tar, "../evil.tex", b"payload")
+
+        with pytest.raises(HTTPException) as exc_info:
+            conversion._extract_archive(archive, tmp_path)
+
+        assert exc_info.value.status_code == 400
+        assert not (tmp_path / "evil.tex").exists()
+
+    def test_bad_tar_member_after_good_ones_removes_extraction(self, tmp_path):
+        """Test that a late unsafe member aborts and discards the extraction."""
+        archive = tmp_path / "project.tar"
+        with tarfile.open(archive, "w") as tar:
+            _add_tar_member(tar, "main.tex", b"\\documentclass{article}")
+            _add_tar_member(tar, "figures/plot.svg", b"<svg/>")
+            _add_tar_member(tar, "../evil.tex", b"payload")
+
+        with pytest.raises(HTTPException) as exc_info:
+            conversion._extract_archive(archive, tmp_path)
+
+        assert exc_info.value.status_code == 400
+        assert not (tmp_path / "evil.tex").exists()
+        assert not (tmp_path / "extracted").exists()
+
+    @pytest.mark.parametrize("link_type", [tarfile.SYMTYPE, tarfile.LNKTYPE])
+    def test_rejects_tar_links(self, tmp_path, link_type):
+        """Test that symlink and hard-link tar members are rejected."""
+        archive = tmp_path / "project.tar"
+        with tarfile.open(archive, "w") as tar:
+            _add_tar_member(tar, "main.tex", b"\\documentclass{article}")
+            link = tarfile.TarInfo("link.tex")
+            link.type = link_type
+            link.linkname = "main.tex"
+            tar.addfile(link)
+
+        with pytest.raises(HTTPException) as exc_info:
+            conversion._extract_archive(archive, tmp_path)
+
+        assert exc_info.value.status_code == 400
+
+    def test_rejects_zip_symlink(self, tmp_path):
+        """Test that ZIP entries flagged as symlinks are rejected."""
+        archive = tmp_path / "project.zip"
+        link = zipfile.ZipInfo("link.tex")
+        link.external_attr = 0o120777 << 16
+        with zipfile.ZipFile(archive, "w") as zipf:
+            zipf.writestr(link, "/etc/passwd")
+
+        with pytest.raises(HTTPException) as exc_info:
+            conversion._extract_archive(archive, tmp_path)
+
+        assert exc_info.value.status_code == 400
+        assert not (tmp_path / "extracted" / "link.tex").exists()
+
+    def test_stops_extraction_after_timeout(self, tmp_path):
+        """Test that extraction gives up once its deadline has passed."""
+        archive = tmp_path / "project.zip"
+        with zipfile.ZipFile(archive, "w") as zipf:
+            zipf.writestr("main.tex", "\\documentclass{article}")
+
+        with pytest.raises(HTTPException) as exc_info:
+            conversion._extract_archive(archive, tmp_path, timeout=-1)
+
+        assert exc_info.value.status_code == 408
+        assert not (tmp_path / "extracted" / "main.tex").exists()
+
+    def test_rejects_archive_over_extracted_size_limit(self, tmp_path, monkeypatch):
+        """Test that the cumulative uncompressed size is capped."""
+        monkeypatch.setattr(settings, "MAX_EXTRACTED_SIZE", 1024)
+        archive = tmp_path / "project.zip"
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("main.tex", "a" * 600)
+            zipf.writestr("appendix.tex", "b" * 600)
+
+        with pytest.raises(HTTPException) as exc_info:
+            conversion._extract_archive(archive, tmp_path)
+
+        assert exc_info.value.status_code == 400
+        assert not (tmp_path / "extracted" / "main.tex").exists()
+
+
+class TestParseConversionOptions:
+    """Test parsing of the options form field."""
+
+    def test_parses_json_object(self):
+        """Test that a JSON object is returned as a dict."""
+        options = '{"latexml_options": {"verbose": true}, "max_processing_time": 900}'
+
+        assert conversion._parse_conversion_options(options) == {
+            "latexml_options": {"verbose": True},
+            "max_processing_time": 900,
+        }
+
+    @pytest.mark.parametrize("options", [None, "", "{not json"])
+    def test_missing_or_invalid_options(self, options):
+        """Test that missing or malformed options yield None."""
+        assert conversion._parse_conversion_options(options) is None
+
+
+class TestUploadPatternScan:
+    """Test suspicious-pattern scanning during upload streaming."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("chunk_size", [520, 600, 1024])
+    async def test_detects_pattern_across_chunk_boundary(
+        self, tmp_path, monkeypatch, chunk_size
+    ):
+        """Test that a pattern split between chunks is still detected."""
+        monkeypatch.setattr(conversion, "_UPLOAD_CHUNK_SIZE", chunk_size)
+        content = b"x" * (chunk_size - 4) + b"<IFRAME src=x>" + b"y" * 20
+
+        with pytest.raises(HTTPException) as exc_info:
+            await conversion._save_upload_file(
+                _upload(content, "project.tar"), tmp_path / "project.tar", ".tar"
+            )
+
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_detects_pattern_beyond_header(self, tmp_path):
+        """Test that patterns after the first 4 KiB are still detected."""
+        content = b"x" * (2 * conversion._UPLOAD_CHUNK_SIZE) + b"<script>"
+
+        with pytest.raises(HTTPException):
+            await conversion._save_upload_file(
+                _upload(content, "project.tar"), tmp_path / "project.tar", ".tar"
+            )
+
+    @pytest.mark.asyncio
+    async def test_skips_compressed_archive_bytes(self, tmp_path):
+        """Test that compressed uploads are left to the extracted-source scan."""
+        content = b"PK" + b"x" * 64 + b"<script>"
+        destination = tmp_path / "project.zip"
+
+        await conversion._save_upload_file(_upload(content), destination, ".zip")
+
+        assert destination.read_bytes() == content
+
+    @pytest.mark.parametrize("name", ["main.tex", "refs.bib", "figures/plot.svg"])
+    def test_rejects_suspicious_extracted_source(self, tmp_path, name):
+        """Test that text sources are scanned after extraction."""
+        (tmp_path / "figures").mkdir()
+        (tmp_path / "intro.tex").write_text("\\section{Intro}")
+        (tmp_path / name).write_text("<svg><script>alert(1)</script></svg>")
+
+        with pytest.raises(HTTPException) as exc_info:
+            conversion._scan_extracted_dir(tmp_path)
+
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.parametrize("chunk_size", [520, 600, 1024])
+    def test_detects_source_pattern_across_chunk_boundary(
+        self, tmp_path, monkeypatch, chunk_size
+    ):
+        """Test that extracted sources are scanned in chunks across boundaries."""
+        monkeypatch.setattr(conversion, "_UPLOAD_CHUNK_SIZE", chunk_size)
+        source = tmp_path / "main.tex"
+        source.write_bytes(b"x" * (chunk_size - 4) + b"<IFRAME src=x>" + b"y" * 20)
+
+        with pytest.raises(HTTPException) as exc_info:
+            conversion._check_source_content(str(source))
+
+        assert exc_info.value.status_code == 400
+
+    def test_ignores_binary_assets(self, tmp_path):
+        """Test that non-text members are not scanned."""
+        (tmp_path / "main.tex").write_text("\\documentclass{article}")
+        (tmp_path / "plot.png").write_bytes(b"\x89PNG<script>")
+
+        assert conversion._scan_extracted_dir(tmp_path)[0] == tmp_path / "main.tex"
+
+
+class TestCreateResultZip:
+    """Test packaging of conversion outputs."""
+
+    def test_stores_precompressed_images(self, tmp_path):
+        """Test that PNGs and PDFs are stored while text assets are deflated."""
+        (tmp_path / "final.html").write_text("<html></html>")
+        (tmp_path / "figures").mkdir()
+        (tmp_path / "figures" / "plot.png").write_bytes(b"\x89PNG" + b"\x00" * 64)
+        (tmp_path / "figures" / "plot.svg").write_text("<svg/>" * 64)
+        (tmp_path / "figures" / "chart.pdf").write_bytes(b"%PDF" + b"\x00" * 64)
+        output_zip = tmp_path / "result.zip"
+
+        conversion._create_result_zip(tmp_path, output_zip)
+
+        with zipfile.ZipFile(output_zip) as zipf:
+            infos = {info.filename: info for info in zipf.infolist()}
+        assert infos["figures/plot.png"].compress_type == zipfile.ZIP_STORED
+        assert infos["figures/chart.pdf"].compress_type == zipfile.ZIP_STORED
+        assert infos["figures/plot.svg"].compress_type == zipfile.ZIP_DEFLATED
+        assert infos["final.html"].compress_type == zipfile.ZIP_DEFLATED
+
+    def test_falls_back_to_latexml_html(self, tmp_path):
+        """Test that latexml/main.html keeps its path when final.html is absent."""
+        (tmp_path / "latexml").mkdir()
+        (tmp_path / "latexml" / "main.html").write_text("<html></html>")
+        output_zip = tmp_path / "result.zip"
+
+        conversion._create_result_zip(tmp_path, output_zip)
+
+        with zipfile.ZipFile(output_zip) as zipf:
+            assert zipf.namelist() == ["latexml/main.html"]
+
+
+class TestCollectResultFiles:
+    """Test collection of result files for packaging."""
+
+    def test_buckets_files_by_suffix(self, tmp_path):
+        """Test that CSS and assets are found at any depth in one walk."""
+        (tmp_path / "latexml" / "figures").mkdir(parents=True)
+        (tmp_path / "style.css").write_text("body {}")
+        (tmp_path / "latexml" / "figures" / "plot.SVG").write_text("<svg/>")
+        (tmp_path / "latexml" / "photo.jpeg").write_bytes(b"\xff\xd8")
+        (tmp_path / "latexml" / "main.html").write_text("<html></html>")
+        (tmp_path / "build.log").write_text("log")
+
+        css_files, asset_files = conversion._collect_result_files(tmp_path)
+
+        assert css_files == [tmp_path / "style.css"]
+        assert sorted(asset_files) == [
+            tmp_path / "latexml" / "figures" / "plot.SVG",
+            tmp_path / "latexml" / "photo.jpeg",
+        ]
+
+
+class TestResultZipFreshness:
+    """Test reuse of a previously built result ZIP."""
+
+    def test_fresh_when_zip_is_newest(self, tmp_path):
+        """Test that a ZIP newer than all outputs is reused."""
+        (tmp_path / "figures").mkdir()
+        (tmp_path / "figures" / "plot.svg").write_text("<svg/>")
+        output_zip = tmp_path / "job_result.zip"
+        output_zip.write_bytes(b"PK")
+        os.utime(tmp_path / "figures" / "plot.svg", (1000, 1000))
+
+        assert conversion._is_result_zip_fresh(tmp_path, output_zip)
+
+    def test_stale_when_output_is_newer(self, tmp_path):
+        """Test that a newer output file forces a rebuild."""
+        output_zip = tmp_path / "job_result.zip"
+        output_zip.write_bytes(b"PK")
+        os.utime(output_zip, (1000, 1000))
+        (tmp_path / "final.html").write_text("<html></html>")
+
+        assert not conversion._is_result_zip_fresh(tmp_path, output_zip)
+
+    def test_stale_when_zip_is_missing(self, tmp_path):
+        """Test that a missing ZIP is never considered fresh."""
+        assert not conversion._is_result_zip_fresh(tmp_path, tmp_path / "x.zip")
+
+
+class TestReplaceResultZip:
+    """Test atomically replacing the result ZIP."""
+
+    def test_failed_build_keeps_previous_zip(self, tmp_path, monkeypatch):
+        """Test that a failed build leaves no partial file behind."""
+        output_zip = tmp_path / "result.zip"
+        output_zip.write_bytes(b"previous")
+
+        def failing_build(output_dir, partial_zip):
+            partial_zip.write_bytes(b"partial")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(conversion, "_create_result_zip", failing_build)
+
+        with pytest.raises(OSError):
+            conversion._replace_result_zip(tmp_path, output_zip)
+
+        assert output_zip.read_bytes() == b"previous"
+        assert not list(tmp_path.glob("*.tmp"))
+
+
+class TestPrebuildResultZip:
+    """Test building the result ZIP when a conversion finishes."""
+
+    def test_builds_and_records_zip_for_completed_job(self, tmp_path):
+        """Test that a completed job gets its archive built and recorded."""
+        (tmp_path / "final.html").write_text("<html></html>")
+        job = SimpleNamespace(
+            job_id="job-zip",
+            output_dir=tmp_path,
+            status=ConversionStatusEnum.COMPLETED,
+        )
+        conversion._safe_set_conversion("job-zip", {"output_dir": str(tmp_path)})
+
+        try:
+            conversion._prebuild_result_zip(job)
+
+            output_zip = tmp_path / "job-zip_result.zip"
+            assert conversion._safe_get_conversion("job-zip")["result_zip"] == str(
+                output_zip
+            )
+            with zipfile.ZipFile(output_zip) as zipf:
+                assert zipf.namelist() == ["final.html"]
+            assert not list(tmp_path.glob("*.tmp"))
+        finally:
+            conversion._safe_remove_conversion("job-zip")
+
+    def test_skips_failed_job(self, tmp_path):
+        """Test that no archive is built for a failed job."""
+        job = SimpleNamespace(
+            job_id="job-failed",
+            output_dir=tmp_path,
+            status=ConversionStatusEnum.FAILED,
+        )
+
+        conversion._prebuild_result_zip(job)
+
+        assert not (tmp_path / "job-failed_result.zip").exists()
+
+
+class TestMakeJobDir:
+    """Test creation of per-job working directories."""
+
+    def test_creates_missing_base_directory(self, tmp_path):
+        """Test that the base directory is created on first use."""
+        job_dir = conversion._make_job_dir(tmp_path / "uploads", "job-1")
+
+        assert job_dir == tmp_path / "uploads" / "job-1"
+        assert job_dir.is_dir()
+
+    def test_rejects_existing_job_directory(self, tmp_path):
+        """Test that a job directory is never silently reused."""
+        conversion._make_job_dir(tmp_path, "job-1")
+
+        with pytest.raises(FileExistsError):
+            conversion._make_job_dir(tmp_path, "job-1")
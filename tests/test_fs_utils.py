@@ -0,0 +1,29 @@
+"""
+Test the filesystem utility functions.
+"""
+
+from app.utils.fs import remove_directories
+
+
+class TestRemoveDirectories:
+    """Test batched directory removal."""
+
+    def test_removes_all_trees(self, tmp_path):
+        """Test that every given tree is removed in one call."""
+        first = tmp_path / "upload" / "extracted" / "figures"
+        second = tmp_path / "output" / "latexml"
+        first.mkdir(parents=True)
+        second.mkdir(parents=True)
+        (first / "plot.svg").write_text("<svg/>")
+        (second / "main.html").write_text("<html></html>")
+
+        remove_directories(tmp_path / "upload", tmp_path / "output")
+
+        assert not (tmp_path / "upload").exists()
+        assert not (tmp_path / "output").exists()
+
+    def test_ignores_missing_paths(self, tmp_path):
+        """Test that missing directories are skipped without error."""
+        remove_directories(tmp_path / "missing")
+
+        assert tmp_path.exists()